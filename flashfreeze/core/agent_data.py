@@ -1,18 +1,19 @@
 # core/agent_data.py
 
-import copy
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+import operator
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple
 
 from flashfreeze.core.drive_disc_data import DriveDisc
 from flashfreeze.core.drive_disc_set_data import DriveDiscSetData
 from flashfreeze.core.skill_data import AgentSkillData
 from flashfreeze.core.w_engine_data import WEngine
 
-from .common import Attribute, Faction, Rarity, Stat, AttackType, Specialty, SkillType
+from .common import ATTACK_TYPE_BITS, EMPTY_MAPPING, Attribute, Faction, Rarity, Stat, AttackType, Specialty, SkillType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentInfo:
     """Represents the 'info' block for an agent."""
     full_name: Optional[str] = None
@@ -20,20 +21,18 @@ class AgentInfo:
     height: Optional[str] = None
     birthday: Optional[str] = None
 
+    # JSON keys in field order, used by from_dict to build positional args
+    _FIELDS = ("full_name", "gender", "height", "birthday")
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'AgentInfo':
+    def from_dict(cls, data: Mapping[str, Any]) -> 'AgentInfo':
         """Creates AgentInfo instance from a dictionary."""
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             return cls() # Return default empty instance if data is not dict
 
-        return cls(
-            full_name=data.get("full_name"),
-            gender=data.get("gender"),
-            height=data.get("height"),
-            birthday=data.get("birthday")
-        )
+        return cls(*(data.get(key) for key in cls._FIELDS))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentBaseStats:
     """Represents the 'base_stats' block for an agent."""
     hp: int = 0
@@ -48,113 +47,140 @@ class AgentBaseStats:
     crit_rate: float = 0.0
     crit_dmg: float = 0.0
 
+    # (JSON key, coerce, default) in field order; keys like 'base_hp' map to 'hp'
+    _FIELDS = (
+        ("base_hp", int, 0),
+        ("base_atk", int, 0),
+        ("base_def", int, 0),
+        ("base_impact", int, 0),
+        ("base_anomaly_mastery", int, 0),
+        ("base_anomaly_proficiency", int, 0),
+        ("base_pen_ratio", float, 0.0),
+        ("base_energy_regen", float, 1.2), # Default to 1.2 if not specified
+        ("base_energy_limit", int, 120), # Default to 120 if not specified
+        ("base_crit_rate", float, 5.0), # Default to 5 if not specified
+        ("base_crit_dmg", float, 50.0), # Default to 50 if not specified
+    )
+    _DEFAULTS = {key: default for key, _, default in _FIELDS}
+    _COERCERS = tuple(coerce for _, coerce, _ in _FIELDS)
+    _get_raw_values = operator.itemgetter(*_DEFAULTS)
+    # Shared default returned on parse failures; safe to share as the class is frozen (set below the class)
+    _DEFAULT = None
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'AgentBaseStats':
+    def from_dict(cls, data: Mapping[str, Any]) -> 'AgentBaseStats':
         """Creates AgentBaseStats instance from a dictionary."""
-        if not isinstance(data, dict):
-            return cls()
+        if not isinstance(data, Mapping):
+            return cls._DEFAULT
 
         try:
-            # Rename keys like 'base_hp' to 'hp' during parsing
-            return cls(
-                hp=int(data.get("base_hp", 0)),
-                atk=int(data.get("base_atk", 0)),
-                defense=int(data.get("base_def", 0)),
-                impact=int(data.get("base_impact", 0)),
-                anomaly_mastery=int(data.get("base_anomaly_mastery", 0)),
-                anomaly_proficiency=int(data.get("base_anomaly_proficiency", 0)),
-                pen_ratio=float(data.get("base_pen_ratio", 0.0)),
-                energy_regen=float(data.get("base_energy_regen", 1.2)), # Default to 1.2 if not specified
-                energy_limit=int(data.get("base_energy_limit", 120)), # Default to 100 if not specified
-                crit_rate=float(data.get("base_crit_rate", 5.0)), # Default to 5 if not specified
-                crit_dmg=float(data.get("base_crit_dmg", 50.0)), # Default to 50 if not specified
-            )
+            # Merge over the defaults, then fetch every value in one itemgetter call
+            raw_values = cls._get_raw_values({**cls._DEFAULTS, **data})
+            return cls(*[coerce(value) for coerce, value in zip(cls._COERCERS, raw_values)])
         except (ValueError, TypeError) as e:
             print(f"Warning: Could not parse base stats data: {data}. Error: {e}")
-            return cls() # Return default on error
+            return cls._DEFAULT # Return default on error
         
-    def add_to_base_stat(self, stat: Stat, value: float):
-        """Adds a value to the corresponding base stat."""
+    def with_added_stat(self, stat: Stat, value: float) -> 'AgentBaseStats':
+        """Returns a copy of these base stats with value added to the corresponding base stat."""
         match stat:
             case Stat.HP:
-                self.hp += int(value)
+                return replace(self, hp=self.hp + int(value))
             case Stat.ATK:
-                self.atk += int(value)
+                return replace(self, atk=self.atk + int(value))
             case Stat.DEF:
-                self.defense += int(value)
+                return replace(self, defense=self.defense + int(value))
             case Stat.IMPACT:
-                self.impact += int(value)
+                return replace(self, impact=self.impact + int(value))
             case Stat.ANOMALY_MASTERY:
-                self.anomaly_mastery += int(value)
+                return replace(self, anomaly_mastery=self.anomaly_mastery + int(value))
             case Stat.ANOMALY_PROFICIENCY:
-                self.anomaly_proficiency += int(value)
+                return replace(self, anomaly_proficiency=self.anomaly_proficiency + int(value))
             case Stat.PEN_RATIO:
-                self.pen_ratio += value
+                return replace(self, pen_ratio=self.pen_ratio + value)
             case Stat.ENERGY_REGEN:
-                self.energy_regen += value
+                return replace(self, energy_regen=self.energy_regen + value)
             case Stat.ENERGY_LIMIT:
-                self.energy_limit += int(value)
+                return replace(self, energy_limit=self.energy_limit + int(value))
             case Stat.CRIT_RATE:
-                self.crit_rate += value
+                return replace(self, crit_rate=self.crit_rate + value)
             case Stat.CRIT_DMG:
-                self.crit_dmg += value
+                return replace(self, crit_dmg=self.crit_dmg + value)
             case _:
                 print(f"Warning: Unsupported stat type {stat}")
+                return self
+
+AgentBaseStats._DEFAULT = AgentBaseStats()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentCoreStat:
     """Represents the 'core_stat' block for an agent."""
     stat: Stat = Stat.UNKNOWN
     value: float = 0.0
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'AgentCoreStat':
+    def from_dict(cls, data: Mapping[str, Any]) -> 'AgentCoreStat':
         """Creates AgentCoreStat instance from a dictionary."""
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             return cls()
 
         try:
-            return cls(
-                stat=Stat.from_string(data.get("stat", "")),
-                value=float(data.get("value", 0.0))
-            )
+            return cls(Stat.from_string(data.get("stat", "")), float(data.get("value", 0.0)))
         except (ValueError, TypeError) as e:
             print(f"Warning: Could not parse core stat data: {data}. Error: {e}")
             return cls() # Return default on error
 
-@dataclass
+def _attack_type_mask(types: List[str]) -> int:
+    """Parses a list of attack type strings into an AttackType bit mask."""
+    mask = 0
+    for _type in types:
+        mask |= ATTACK_TYPE_BITS.get(_type.lower(), 0)
+    return mask
+
+@dataclass(slots=True, frozen=True) # Shared between callers by gdl.get_agent, so immutable
 class AgentData:
     """Represents all data for a single agent."""
     name: str # The key from the top-level JSON (e.g., "Ellen")
     attribute: Attribute = Attribute.UNKNOWN
     specialty: Specialty = Specialty.UNKNOWN
     faction: Faction = Faction.UNKNOWN
-    type: List[AttackType] = field(default_factory=list)
+    type_mask: int = 0 # OR of AttackType.bit flags
     rarity: Rarity = Rarity.UNKNOWN
     info: AgentInfo = field(default_factory=AgentInfo)
     base_stats: AgentBaseStats = field(default_factory=AgentBaseStats)
     core_stat: AgentCoreStat = field(default_factory=AgentCoreStat)
     skills: Optional[AgentSkillData] = None
 
+    # (JSON key, parse, default) for the fields following 'name', in field order
+    _FIELDS = (
+        ("attribute", Attribute.from_string, ""),
+        ("specialty", Specialty.from_string, ""),
+        ("faction", Faction.from_string, ""),
+        ("type", _attack_type_mask, ()),
+        ("rarity", Rarity.from_string, ""),
+        ("info", AgentInfo.from_dict, EMPTY_MAPPING),
+        ("base_stats", AgentBaseStats.from_dict, EMPTY_MAPPING),
+        ("core_stat", AgentCoreStat.from_dict, EMPTY_MAPPING),
+    )
+
     @classmethod
     def from_dict(cls, name: str, data: Dict[str, Any]) -> Optional['AgentData']:
         """Creates AgentData instance from the agent's dictionary."""
         if not isinstance(data, dict):
             return None
 
-        return cls(
-            name=name,
-            attribute=Attribute.from_string(data.get("attribute", "")),
-            specialty=Specialty.from_string(data.get("specialty", "")),
-            faction=Faction.from_string(data.get("faction", "")),
-            type=[AttackType.from_string(_type) for _type in data.get("type", [])],
-            rarity=Rarity.from_string(data.get("rarity", "")),
-            info=AgentInfo.from_dict(data.get("info", {})),
-            base_stats=AgentBaseStats.from_dict(data.get("base_stats", {})),
-            core_stat=AgentCoreStat.from_dict(data.get("core_stat", {}))
-        )
+        return cls(name, *[parse(data.get(key, default)) for key, parse, default in cls._FIELDS])
+
+    @property
+    def type(self) -> List[AttackType]:
+        """Returns the agent's attack types decoded from type_mask."""
+        return [attack_type for attack_type in AttackType if self.type_mask & attack_type.bit]
+
+    def has_type(self, attack_type: AttackType) -> bool:
+        """Checks whether the agent has the given attack type."""
+        return bool(self.type_mask & attack_type.bit)
     
-@dataclass
+@dataclass(slots=True)
 class AgentBonusStats:
     """Represents the total pre-combat stats of an agent."""
     hp: int = 0
@@ -184,59 +210,46 @@ class AgentBonusStats:
 
     def add_stat(self, stat: Stat, value: float):
         """Adds a value to the specified stat in this AgentStats instance."""
-        match stat:
-            case Stat.HP:
-                self.hp += int(value)
-            case Stat.HP_PERCENT:
-                self.hp_percent += value
-            case Stat.ATK:
-                self.atk += int(value)
-            case Stat.ATK_PERCENT:
-                self.atk_percent += value
-            case Stat.DEF:
-                self.defense += int(value)
-            case Stat.DEF_PERCENT:
-                self.def_percent += value
-            case Stat.IMPACT:
-                self.impact += int(value)
-            case Stat.IMPACT_PERCENT:
-                self.impact_percent += value
-            case Stat.CRIT_RATE:
-                self.crit_rate += value
-            case Stat.CRIT_DMG:
-                self.crit_dmg += value
-            case Stat.ANOMALY_MASTERY:
-                self.anomaly_mastery += int(value)
-            case Stat.ANOMALY_MASTERY_PERCENT:
-                self.anomaly_mastery_percent += value
-            case Stat.ANOMALY_PROFICIENCY:
-                self.anomaly_proficiency += int(value)
-            case Stat.PEN_RATIO:
-                self.pen_ratio += value
-            case Stat.PEN:
-                self.pen += int(value)
-            case Stat.ENERGY_REGEN:
-                self.energy_regen += value
-            case Stat.ENERGY_REGEN_PERCENT:
-                self.energy_regen_percent += value
-            case Stat.ENERGY_GENERATION_RATE:
-                self.energy_generation_rate += value
-            case Stat.ENERGY_LIMIT:
-                self.energy_limit += int(value)
-            case Stat.PHYSICAL_DMG:
-                self.physical_dmg += value
-            case Stat.FIRE_DMG:
-                self.fire_dmg += value
-            case Stat.ICE_DMG:
-                self.ice_dmg += value
-            case Stat.ELECTRIC_DMG:
-                self.electric_dmg += value
-            case Stat.ETHER_DMG:
-                self.ether_dmg += value
-            case _:
-                print(f"Warning: Unsupported stat type {stat}")
-
-@dataclass
+        target = _BONUS_STAT_TARGETS_BY_INDEX[stat.index]
+        if target is None:
+            print(f"Warning: Unsupported stat type {stat}")
+            return
+        name, is_int = target
+        setattr(self, name, getattr(self, name) + (int(value) if is_int else value))
+
+# Stat -> (AgentBonusStats attribute, whether the value is truncated to int)
+_BONUS_STAT_TARGETS: Dict[Stat, Tuple[str, bool]] = {
+    Stat.HP: ("hp", True),
+    Stat.HP_PERCENT: ("hp_percent", False),
+    Stat.ATK: ("atk", True),
+    Stat.ATK_PERCENT: ("atk_percent", False),
+    Stat.DEF: ("defense", True),
+    Stat.DEF_PERCENT: ("def_percent", False),
+    Stat.IMPACT: ("impact", True),
+    Stat.IMPACT_PERCENT: ("impact_percent", False),
+    Stat.CRIT_RATE: ("crit_rate", False),
+    Stat.CRIT_DMG: ("crit_dmg", False),
+    Stat.ANOMALY_MASTERY: ("anomaly_mastery", True),
+    Stat.ANOMALY_MASTERY_PERCENT: ("anomaly_mastery_percent", False),
+    Stat.ANOMALY_PROFICIENCY: ("anomaly_proficiency", True),
+    Stat.PEN_RATIO: ("pen_ratio", False),
+    Stat.PEN: ("pen", True),
+    Stat.ENERGY_REGEN: ("energy_regen", False),
+    Stat.ENERGY_REGEN_PERCENT: ("energy_regen_percent", False),
+    Stat.ENERGY_GENERATION_RATE: ("energy_generation_rate", False),
+    Stat.ENERGY_LIMIT: ("energy_limit", True),
+    Stat.PHYSICAL_DMG: ("physical_dmg", False),
+    Stat.FIRE_DMG: ("fire_dmg", False),
+    Stat.ICE_DMG: ("ice_dmg", False),
+    Stat.ELECTRIC_DMG: ("electric_dmg", False),
+    Stat.ETHER_DMG: ("ether_dmg", False),
+}
+# Same table indexed by Stat.index, None for stats AgentBonusStats does not track
+_BONUS_STAT_TARGETS_BY_INDEX: Tuple[Optional[Tuple[str, bool]], ...] = tuple(
+    _BONUS_STAT_TARGETS.get(stat) for stat in Stat
+)
+
+@dataclass(slots=True)
 class AgentTotalStats:
     """Represents the total pre-combat stats of an agent."""
     hp: int = 0
@@ -260,27 +273,45 @@ class AgentTotalStats:
     @classmethod
     def from_base_and_bonus(cls, base_stats: AgentBaseStats, bonus_stats: AgentBonusStats) -> 'AgentTotalStats':
         """Calculates total stats by combining base and bonus stats."""
-        return cls(
-            hp=int(base_stats.hp * (1 + bonus_stats.hp_percent/100) + bonus_stats.hp),
-            atk=int(base_stats.atk * (1 + bonus_stats.atk_percent/100) + bonus_stats.atk),
-            defense=int(base_stats.defense * (1 + bonus_stats.def_percent/100) + bonus_stats.defense),
-            impact=int(base_stats.impact * (1 + bonus_stats.impact_percent/100) + bonus_stats.impact),
-            crit_rate=base_stats.crit_rate + bonus_stats.crit_rate,
-            crit_dmg=base_stats.crit_dmg + bonus_stats.crit_dmg,
-            anomaly_mastery=int(base_stats.anomaly_mastery * (1 + bonus_stats.anomaly_mastery_percent/100) + bonus_stats.anomaly_mastery),
-            anomaly_proficiency=base_stats.anomaly_proficiency + bonus_stats.anomaly_proficiency,
-            pen_ratio=base_stats.pen_ratio + bonus_stats.pen_ratio,
-            pen=bonus_stats.pen,  # Only from bonuses
-            energy_regen=base_stats.energy_regen * (1 + bonus_stats.energy_regen_percent/100) + bonus_stats.energy_regen,
-            energy_limit=base_stats.energy_limit + bonus_stats.energy_limit,
-            physical_dmg=bonus_stats.physical_dmg,  # Only from bonuses
-            fire_dmg=bonus_stats.fire_dmg,
-            ice_dmg=bonus_stats.ice_dmg,
-            electric_dmg=bonus_stats.electric_dmg,
-            ether_dmg=bonus_stats.ether_dmg,
-        )
+        # Single-loadout case of from_base_and_bonus_batch, which holds the stat formulas
+        return cls.from_base_and_bonus_batch(base_stats, (bonus_stats,))[0]
+
+    @classmethod
+    def from_base_and_bonus_batch(cls, base_stats: AgentBaseStats, bonus_stats_list: Iterable[AgentBonusStats]) -> List['AgentTotalStats']:
+        """
+        Calculates total stats for many candidate bonus stats sharing the same base stats,
+        e.g. when comparing gear loadouts. Base stat reads are hoisted out of the loop.
+        This is the only place the total stat formulas live; from_base_and_bonus calls it.
+        """
+        base_hp, base_atk, base_def = base_stats.hp, base_stats.atk, base_stats.defense
+        base_impact, base_am = base_stats.impact, base_stats.anomaly_mastery
+        base_crit_rate, base_crit_dmg = base_stats.crit_rate, base_stats.crit_dmg
+        base_ap, base_pen_ratio = base_stats.anomaly_proficiency, base_stats.pen_ratio
+        base_er, base_energy_limit = base_stats.energy_regen, base_stats.energy_limit
+        return [
+            cls(
+                int(base_hp * (1 + bonus.hp_percent/100) + bonus.hp), # hp
+                int(base_atk * (1 + bonus.atk_percent/100) + bonus.atk), # atk
+                int(base_def * (1 + bonus.def_percent/100) + bonus.defense), # defense
+                int(base_impact * (1 + bonus.impact_percent/100) + bonus.impact), # impact
+                base_crit_rate + bonus.crit_rate, # crit_rate
+                base_crit_dmg + bonus.crit_dmg, # crit_dmg
+                int(base_am * (1 + bonus.anomaly_mastery_percent/100) + bonus.anomaly_mastery), # anomaly_mastery
+                base_ap + bonus.anomaly_proficiency, # anomaly_proficiency
+                base_pen_ratio + bonus.pen_ratio, # pen_ratio
+                bonus.pen, # pen: Only from bonuses
+                base_er * (1 + bonus.energy_regen_percent/100) + bonus.energy_regen, # energy_regen
+                base_energy_limit + bonus.energy_limit, # energy_limit
+                bonus.physical_dmg, # physical_dmg: Only from bonuses
+                bonus.fire_dmg, # fire_dmg
+                bonus.ice_dmg, # ice_dmg
+                bonus.electric_dmg, # electric_dmg
+                bonus.ether_dmg, # ether_dmg
+            )
+            for bonus in bonus_stats_list
+        ]
 
-@dataclass
+@dataclass(slots=True)
 class AgentSkillLevels:
     """Represents the skill levels for an agent."""
     skill_levels: Dict[SkillType, int] = field(default_factory=dict)
@@ -289,7 +320,7 @@ class AgentSkillLevels:
         """Returns the level of a specific skill."""
         return self.skill_levels.get(skill_name, 0)
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Represents an agent instance in a specific combat/calculation state."""
     # Static base data for the agent
@@ -307,6 +338,8 @@ class Agent:
     skill_levels: Dict[SkillType, int] = field(default_factory=dict)
 
     # --- Caching ---
+    # Assigning any of these fields marks the cached total stats as stale
+    _STAT_AFFECTING_FIELDS = frozenset({"level", "promotion", "mindscape", "w_engine", "drive_discs", "skill_levels"})
     _cached_total_stats: Optional[AgentTotalStats] = field(default=None, init=False, repr=False, compare=False, hash=False)
 
     def __post_init__(self):
@@ -328,43 +361,35 @@ class Agent:
             print(f"Warning: Level {self.level} is out of range for promotion {self.promotion}. Adjusting.")
             self.level = max(min_level, min(self.level, max_level))
 
-        # Recalculate total stats on initialization
-        self.recalculate_total_stats()
+        # Total stats are computed lazily on first access of total_stats
 
     def get_active_set_counts(self) -> Dict[DriveDiscSetData, int]:
         """Counts how many pieces of each set are equipped."""
-        set_counts: Dict[DriveDiscSetData, int] = {}
-        if not self.drive_discs:
-            return {}
-        for disc in self.drive_discs.values():
-            set_data = disc.set_data
-            set_counts[set_data] = set_counts.get(set_data, 0) + 1
-        return set_counts
+        return Counter(disc.set_data for disc in self.drive_discs.values())
 
     def get_bonus_stats(self) -> AgentBonusStats:
         """Internal method to collect all bonus stats from the Agent's gear."""
         # --- Step 0: Create an AgentBonusStats object to accumulate bonuses ---
         bonus_stats = AgentBonusStats()
+        add_stat = bonus_stats.add_stat # Bound once, called for every gear stat below
 
         # --- Step 1: W-Engine Advanced Stat ---
         if self.w_engine:
             adv_stat_info = self.w_engine.get_advanced_stat()
             if adv_stat_info:
                 adv_s_type, adv_s_value = adv_stat_info
-                bonus_stats.add_stat(adv_s_type, adv_s_value)
+                add_stat(adv_s_type, adv_s_value)
 
         # --- Step 2: Drive Discs Main & Substats ---
-        if self.drive_discs:
-            for slot, disc in self.drive_discs.items():
+        drive_discs = self.drive_discs
+        if drive_discs:
+            for disc in drive_discs.values():
                 # Main Stat
-                main_s_type = disc.main_stat_type
-                main_s_value = disc.get_main_stat_value() # Uses level/rarity
-                bonus_stats.add_stat(main_s_type, main_s_value)
+                add_stat(disc.main_stat_type, disc.get_main_stat_value()) # Uses level/rarity
 
                 # Substats
-                substats = disc.get_all_substat_values() # Uses rarity/rolls
-                for sub_s_type, sub_s_value in substats.items():
-                    bonus_stats.add_stat(sub_s_type, sub_s_value)
+                for sub_s_type, sub_s_value in disc.get_all_substat_values().items(): # Uses rarity/rolls
+                    add_stat(sub_s_type, sub_s_value)
 
         # --- Step 3: Drive Disc 2-Piece Set Bonuses ---
             set_counts = self.get_active_set_counts()
@@ -374,14 +399,14 @@ class Agent:
                         bonus_stat = set_data.bonus_2pc.simple_stat
                         bonus_value = set_data.bonus_2pc.value
                         if bonus_stat and bonus_value is not None:
-                            bonus_stats.add_stat(bonus_stat, bonus_value)
+                            add_stat(bonus_stat, bonus_value)
 
         return bonus_stats
 
-    def recalculate_total_stats(self):
-        """Recalculates the total stats by combining base and bonus stats."""
+    def recalculate_total_stats(self) -> AgentTotalStats:
+        """Recalculates the total stats by combining base and bonus stats, caches and returns them."""
         bonus_stats = self.get_bonus_stats()
-        base_stats_with_core = copy.deepcopy(self.base_agent_data.base_stats)
+        base_stats_with_core = self.base_agent_data.base_stats # Frozen; with_added_stat returns new copies
         # Add core stats to base stats
         core_skill_level = self.skill_levels.get(SkillType.CORE_SKILL, 0)
         if core_skill_level > 0 and self.base_agent_data.core_stat:
@@ -390,26 +415,26 @@ class Agent:
             for level in range(1, core_skill_level + 1):
                 if level % 2 == 1:  # Odd levels - apply core stat
                      if core_s_type and core_s_value is not None:
-                        base_stats_with_core.add_to_base_stat(core_s_type, core_s_value)
+                        base_stats_with_core = base_stats_with_core.with_added_stat(core_s_type, core_s_value)
                 else:  # Even levels - apply base ATK
-                     base_stats_with_core.add_to_base_stat(Stat.ATK, 25)
+                     base_stats_with_core = base_stats_with_core.with_added_stat(Stat.ATK, 25)
         new_total_stats = AgentTotalStats.from_base_and_bonus(
             base_stats_with_core, bonus_stats
         )
         # Use object.__setattr__ to avoid recursion with custom __setattr__
         object.__setattr__(self, '_cached_total_stats', new_total_stats)
+        return new_total_stats
 
     @property
     def total_stats(self) -> AgentTotalStats:
         """Returns the total stats of the agent, recalculating if necessary."""
-        if self._cached_total_stats is None:
-            self.recalculate_total_stats()
-            if self._cached_total_stats is None:
-                 raise RuntimeError("Recalculation failed to populate cache.")
-        return self._cached_total_stats
+        total_stats = self._cached_total_stats
+        if total_stats is None:
+            total_stats = self.recalculate_total_stats()
+        return total_stats
 
     def __setattr__(self, name, value):
-        """Override setattr to recalculate total stats when properties change."""
+        """Override setattr to invalidate cached total stats when properties change."""
         object.__setattr__(self, name, value)
-        if hasattr(self, '_cached_total_stats') and name in {"level", "promotion", "mindscape", "w_engine", "drive_discs", "skill_levels"}:
+        if name in self._STAT_AFFECTING_FIELDS and hasattr(self, '_cached_total_stats'):
             object.__setattr__(self, '_cached_total_stats', None)
\ No newline at end of file
@@ -1,13 +1,22 @@
 from enum import Enum
+from types import MappingProxyType
+from typing import Any, Mapping
 
 class StringEnum(Enum):
     @classmethod
     def from_string(cls, value: str) -> 'StringEnum':
         """Safely create enum from string value."""
-        for item in cls:
-            if item.value.lower() == value.lower():
-                return item
-        return cls.UNKNOWN
+        # Value -> member map (exact and lowercased spellings), built once per subclass on first use
+        lookup = cls.__dict__.get('_lookup')
+        if lookup is None:
+            lookup = {item.value.lower(): item for item in cls}
+            lookup.update((item.value, item) for item in cls)
+            cls._lookup = lookup
+        # Data files use the canonical spelling, so try it before paying for .lower()
+        member = lookup.get(value)
+        if member is None:
+            member = lookup.get(value.lower(), cls.UNKNOWN)
+        return member
 
 class Attribute(StringEnum):
     PHYSICAL = "Physical"
@@ -51,12 +60,15 @@ class Stat(StringEnum):
     ETHER_DMG = "Ether DMG"
     UNKNOWN = "Unknown"
 
-    def get_damage_bonus_stats() -> set:
-        """Returns a set of damage bonus stats."""
-        return {
-            Stat.PHYSICAL_DMG, Stat.FIRE_DMG, Stat.ICE_DMG,
-            Stat.ELECTRIC_DMG, Stat.ETHER_DMG
-        }
+    def get_damage_bonus_stats() -> frozenset:
+        """Returns a set of damage bonus stats (shared constant, built once)."""
+        return DAMAGE_BONUS_STATS
+
+# Built once at import; Stat.get_damage_bonus_stats() hands out this same frozenset
+DAMAGE_BONUS_STATS = frozenset({
+    Stat.PHYSICAL_DMG, Stat.FIRE_DMG, Stat.ICE_DMG,
+    Stat.ELECTRIC_DMG, Stat.ETHER_DMG
+})
 
 class Faction(StringEnum):
     CUNNING_HARES = "Cunning Hares"
@@ -86,10 +98,29 @@ class AttackType(StringEnum):
     PIERCE = "Pierce"
     UNKNOWN = "Unknown"
 
+
 class Specialty(StringEnum):
     ANOMALY = "Anomaly"
     ATTACK = "Attack"
     DEFENSE = "Defense"
     STUN = "Stun"
     SUPPORT = "Support"
-    UNKNOWN = "Unknown"
\ No newline at end of file
+    UNKNOWN = "Unknown"
+
+# Give every member a dense 0-based index in definition order, so hot paths can
+# index tuples by member instead of hashing enum members (Enum.__hash__ is pure Python)
+for _enum_cls in StringEnum.__subclasses__():
+    for _index, _member in enumerate(_enum_cls):
+        _member.index = _index
+
+# Give each known AttackType a bit flag so a set of types fits in one int (see AgentData.type_mask)
+for _attack_type in AttackType:
+    _attack_type.bit = 0 if _attack_type is AttackType.UNKNOWN else 1 << _attack_type.index
+
+del _enum_cls, _index, _member, _attack_type
+
+# Lowercased attack type string -> bit flag, for parsing type lists straight into a mask
+ATTACK_TYPE_BITS = {attack_type.value.lower(): attack_type.bit for attack_type in AttackType}
+
+# Shared default for missing blocks and lookup levels; read-only, so a mutation raises TypeError
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
@@ -1,14 +1,19 @@
 # core/drive_disc_data.py
 
+import logging
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Set
 
 from .common import Stat, Rarity
 from .drive_disc_set_data import DriveDiscSetData # To link equipped disc to its set bonus info
 # Import game_data_loader to fetch main/sub stat values from JSON
 from .. import game_data_loader as gdl
 
+_log = logging.getLogger(__name__)
+
 # --- Constants Defining Drive Disc Rules ---
 
 # Using Stat Enum members directly
@@ -21,17 +26,25 @@ POSSIBLE_MAIN_STATS_PER_SLOT: Dict[int, List[Stat]] = {
     5: [Stat.HP_PERCENT, Stat.ATK_PERCENT, Stat.DEF_PERCENT, Stat.PEN_RATIO, Stat.PHYSICAL_DMG, Stat.FIRE_DMG, Stat.ICE_DMG, Stat.ELECTRIC_DMG, Stat.ETHER_DMG],
     6: [Stat.HP_PERCENT, Stat.ATK_PERCENT, Stat.DEF_PERCENT, Stat.ANOMALY_MASTERY, Stat.IMPACT, Stat.ENERGY_REGEN]
 }
+# POSSIBLE_MAIN_STATS_PER_SLOT as bit masks over Stat.index, indexed by slot (index 0 unused)
+_MAIN_STAT_ALLOWED_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << stat.index for stat in POSSIBLE_MAIN_STATS_PER_SLOT.get(slot, ())) for slot in range(7)
+)
 
 POSSIBLE_SUBSTATS: Set[Stat] = { # Use a set for faster lookups
     Stat.HP, Stat.ATK, Stat.DEF, Stat.HP_PERCENT, Stat.ATK_PERCENT, Stat.DEF_PERCENT,
     Stat.PEN, Stat.CRIT_RATE, Stat.CRIT_DMG, Stat.ANOMALY_PROFICIENCY
 }
+# POSSIBLE_SUBSTATS as a bit mask over Stat.index, for validating substats without set lookups
+_SUBSTAT_ALLOWED_MASK: int = sum(1 << stat.index for stat in POSSIBLE_SUBSTATS)
 
 MAX_LEVEL_PER_RARITY: Dict[Rarity, int] = {
     Rarity.B: 9,
     Rarity.A: 12,
     Rarity.S: 15
 }
+# Same as MAX_LEVEL_PER_RARITY, indexed by Rarity.index (None for rarities without discs)
+_MAX_LEVEL_BY_RARITY_INDEX: Tuple[Optional[int], ...] = tuple(MAX_LEVEL_PER_RARITY.get(rarity) for rarity in Rarity)
 
 # Min/Max starting substats
 STARTING_SUBSTATS_PER_RARITY: Dict[Rarity, Tuple[int, int]] = {
@@ -46,15 +59,38 @@ SUBSTAT_UPGRADE_LEVELS: List[int] = [3, 6, 9, 12, 15]
 MAX_SUBSTATS_COUNT: int = 4
 MAX_SUBSTAT_ROLLS: int = 5 # Max number of *upgrades* (total value multiplier is rolls+1)
 
+# --- Lookup Miss Reporting ---
+# Each helper logs a given miss at most once, so a missing JSON entry hit in a
+# tight loop does not turn into a flood of identical log records
+
+@lru_cache(maxsize=None)
+def _warn_missing_substat_base(rarity: Rarity, stat: Stat) -> None:
+    _log.warning("Base value not found for substat %s (Rarity: %s). Returning 0.", stat.name, rarity.name)
+
+@lru_cache(maxsize=None)
+def _note_main_stat_fallback(rarity: Rarity, stat: Stat, level: int, max_level: int) -> None:
+    _log.info("Main stat value not found for %s %s at level %d. Attempting fallback to max level %d.",
+              rarity.name, stat.name, level, max_level)
+
+@lru_cache(maxsize=None)
+def _warn_missing_main_stat(rarity: Rarity, stat: Stat, max_level: Optional[int]) -> None:
+    _log.warning("Max level (%s) main stat value also not found for %s %s. Returning 0.",
+                 max_level, rarity.name, stat.name)
+
 # --- Core Logic Classes ---
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubStatInstance:
     """Represents a specific substat on an equipped Drive Disc."""
     stat_type: Stat
     # Number of times this substat has been rolled/upgraded (starts at 0 for initial value)
     rolls: int = 0 # 0 means base value, 1 means base + 1 upgrade, etc.
 
+    def __post_init__(self):
+        """Validate the roll count, so value calculations can rely on it."""
+        if not 0 <= self.rolls <= MAX_SUBSTAT_ROLLS:
+            raise ValueError(f"Invalid number of rolls ({self.rolls}) for substat '{self.stat_type.value}'. Must be 0-{MAX_SUBSTAT_ROLLS}.")
+
     def get_value(self, rarity: Rarity) -> float:
         """
         Calculates the value of this substat based on its type, rarity, and rolls.
@@ -63,18 +99,14 @@ class SubStatInstance:
         # 1. Get base value from game_data_loader
         base_value = gdl.get_drive_substat_base_value(rarity, self.stat_type)
         if base_value is None:
-            print(f"Warning: Base value not found for substat {self.stat_type.name} (Rarity: {rarity.name}). Returning 0.")
+            _warn_missing_substat_base(rarity, self.stat_type)
             return 0.0
 
-        # 2. Calculate final value: base * (rolls + 1)
-        # Clamp rolls just in case (shouldn't exceed MAX_SUBSTAT_ROLLS)
-        actual_rolls = min(self.rolls, MAX_SUBSTAT_ROLLS)
-        final_value = base_value * (actual_rolls + 1)
-
-        return final_value
+        # 2. Calculate final value: base * (rolls + 1); rolls were range-checked in __post_init__
+        return base_value * (self.rolls + 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveDisc:
     """Represents a specific Drive Disc instance to be equipped by an agent."""
     # Reference to the static set data (loaded elsewhere)
@@ -83,12 +115,23 @@ class DriveDisc:
     level: int # Current level (0-15)
     slot: int  # Slot number (1-6)
     main_stat_type: Stat
-    sub_stats: List[SubStatInstance] = field(default_factory=list)
+    # Stored as a tuple (lists are converted on assignment), so the substats can only
+    # change by reassigning the field, which clears the caches below
+    sub_stats: Tuple[SubStatInstance, ...] = ()
+
+    # --- Caching ---
+    # Assigning any of these fields clears the cached stat values
+    _STAT_AFFECTING_FIELDS = frozenset({"rarity", "level", "main_stat_type", "sub_stats"})
+    _cached_main_stat_value: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _cached_substat_values: Optional[Mapping[Stat, float]] = field(default=None, init=False, repr=False, compare=False)
+    # Assigning any of these fields clears the cached packed key (see key())
+    _KEY_FIELDS = _STAT_AFFECTING_FIELDS | {"slot"}
+    _cached_key: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate data after initialization."""
         # Clamp level based on rarity
-        max_level = MAX_LEVEL_PER_RARITY.get(self.rarity, 0)
+        max_level = _MAX_LEVEL_BY_RARITY_INDEX[self.rarity.index] or 0
         self.level = max(0, min(self.level, max_level))
 
         # Validate slot
@@ -96,26 +139,25 @@ class DriveDisc:
             raise ValueError(f"Invalid slot number: {self.slot}. Must be 1-6.")
 
         # Validate main stat for slot
-        if self.main_stat_type not in POSSIBLE_MAIN_STATS_PER_SLOT.get(self.slot, []):
+        if not _MAIN_STAT_ALLOWED_MASKS[self.slot] >> self.main_stat_type.index & 1:
              raise ValueError(f"Invalid main stat '{self.main_stat_type.value}' for slot {self.slot}.")
 
         # Validate substats
         if len(self.sub_stats) > MAX_SUBSTATS_COUNT:
             raise ValueError(f"Cannot have more than {MAX_SUBSTATS_COUNT} substats.")
-        sub_stat_types = set()
+        seen_mask = 0 # Bit mask over Stat.index of substats already validated
         total_sub_rolls = 0
         for i, sub in enumerate(self.sub_stats):
             if not isinstance(sub, SubStatInstance):
                  raise TypeError(f"sub_stats list must contain SubStatInstance objects, found {type(sub)} at index {i}.")
             if sub.stat_type == self.main_stat_type:
                  raise ValueError(f"Substat '{sub.stat_type.value}' cannot be the same as main stat.")
-            if sub.stat_type not in POSSIBLE_SUBSTATS:
+            stat_bit = 1 << sub.stat_type.index
+            if not _SUBSTAT_ALLOWED_MASK & stat_bit:
                  raise ValueError(f"Invalid substat type: '{sub.stat_type.value}'.")
-            if sub.stat_type in sub_stat_types:
+            if seen_mask & stat_bit:
                  raise ValueError(f"Duplicate substat type found: '{sub.stat_type.value}'.")
-            sub_stat_types.add(sub.stat_type)
-            if not 0 <= sub.rolls <= MAX_SUBSTAT_ROLLS:
-                 raise ValueError(f"Invalid number of rolls ({sub.rolls}) for substat '{sub.stat_type.value}'. Must be 0-{MAX_SUBSTAT_ROLLS}.")
+            seen_mask |= stat_bit
             total_sub_rolls += sub.rolls
         if total_sub_rolls > MAX_SUBSTAT_ROLLS:
             raise ValueError(f"Total substat rolls ({total_sub_rolls}) exceed maximum allowed ({MAX_SUBSTAT_ROLLS}).")
@@ -124,7 +166,65 @@ class DriveDisc:
         # Could add validation for number of substats/rolls vs level/rarity, but complex
         # It might be better handled when *creating* the disc instance from DB data
 
+    @classmethod
+    def from_raw(cls, set_data: DriveDiscSetData, rarity: Rarity, level: int, slot: int,
+                 main_stat_type: Stat, sub_stats: Iterable[SubStatInstance]) -> 'DriveDisc':
+        """
+        Creates a DriveDisc without running __post_init__ validation or level clamping.
+        Only use this for data that is already known to be valid (e.g., rows saved from a
+        previously validated disc); anything user-supplied should go through the normal constructor.
+        """
+        disc = cls.__new__(cls)
+        set_attr = object.__setattr__ # Skip the cache-invalidating __setattr__ below
+        set_attr(disc, 'set_data', set_data)
+        set_attr(disc, 'rarity', rarity)
+        set_attr(disc, 'level', level)
+        set_attr(disc, 'slot', slot)
+        set_attr(disc, 'main_stat_type', main_stat_type)
+        set_attr(disc, 'sub_stats', tuple(sub_stats))
+        set_attr(disc, '_cached_main_stat_value', None)
+        set_attr(disc, '_cached_substat_values', None)
+        set_attr(disc, '_cached_key', None)
+        return disc
+
+    def key(self) -> Tuple[str, int]:
+        """
+        Returns a hashable key identifying this disc's value-defining fields, for building
+        dedup sets/dicts of discs (DriveDisc itself is mutable and not hashable).
+        The key is (set name, packed fields): bits 0-14 hold rarity, slot, level and main stat,
+        followed by 8 bits per (substat, rolls) pair. Raises ValueError for a slot, level or
+        substat count that does not fit its bits, e.g. an invalid disc built with from_raw.
+        """
+        packed = self._cached_key
+        if packed is None:
+            if not 1 <= self.slot <= 6:
+                raise ValueError(f"Cannot build key for slot {self.slot}. Must be 1-6.")
+            if not 0 <= self.level <= 15:
+                raise ValueError(f"Cannot build key for level {self.level}. Must be 0-15.")
+            if len(self.sub_stats) > MAX_SUBSTATS_COUNT:
+                raise ValueError(f"Cannot build key for more than {MAX_SUBSTATS_COUNT} substats.")
+            # Rarity.index < 8 and Stat.index < 32, so 3 and 5 bits always suffice
+            packed = self.rarity.index | self.slot << 3 | self.level << 6 | self.main_stat_type.index << 10
+            shift = 15
+            for sub in self.sub_stats:
+                # Substat type is stored as index + 1 so an empty position packs to 0; rolls are 0-5
+                packed |= ((sub.stat_type.index + 1) | sub.rolls << 5) << shift
+                shift += 8
+            object.__setattr__(self, '_cached_key', packed)
+        return (self.set_data.name, packed)
+
     def get_main_stat_value(self) -> float:
+        """
+        Returns the value of the main stat based on type, rarity, and level.
+        The value is computed on first call and cached until one of those fields is reassigned.
+        """
+        value = self._cached_main_stat_value
+        if value is None:
+            value = self._lookup_main_stat_value()
+            self._cached_main_stat_value = value
+        return value
+
+    def _lookup_main_stat_value(self) -> float:
         """
         Calculates the value of the main stat based on type, rarity, and level.
         Uses gdl to fetch main stat values.
@@ -136,28 +236,42 @@ class DriveDisc:
 
         if value is None:
              # Value for current level not found, try getting max level value
-             max_level_for_rarity = MAX_LEVEL_PER_RARITY.get(self.rarity)
+             max_level_for_rarity = _MAX_LEVEL_BY_RARITY_INDEX[self.rarity.index]
              if max_level_for_rarity is not None:
-                 print(f"Info: Main stat value not found for {self.rarity.name} {self.main_stat_type.name} at level {self.level}. "
-                       f"Attempting fallback to max level {max_level_for_rarity}.")
+                 _note_main_stat_fallback(self.rarity, self.main_stat_type, self.level, max_level_for_rarity)
                  value = gdl.get_drive_main_stat_value(self.rarity, self.main_stat_type, max_level_for_rarity)
 
              # If max level value is also None, return 0 as final fallback
              if value is None:
-                 print(f"Warning: Max level ({max_level_for_rarity}) main stat value also not found for "
-                       f"{self.rarity.name} {self.main_stat_type.name}. Returning 0.")
+                 _warn_missing_main_stat(self.rarity, self.main_stat_type, max_level_for_rarity)
                  return 0.0
 
         # Return the found value (either for current level or max level)
         return value
 
-    def get_all_substat_values(self) -> Dict[Stat, float]:
-        """Calculates and returns a dictionary of {Stat: value} for all substats."""
-        sub_values: Dict[Stat, float] = {}
-        for sub in self.sub_stats:
-            sub_values[sub.stat_type] = sub.get_value(self.rarity)
+    def get_all_substat_values(self) -> Mapping[Stat, float]:
+        """
+        Returns a read-only mapping of {Stat: value} for all substats.
+        The mapping is cached and shared between calls; copy it with dict() to modify it.
+        """
+        sub_values = self._cached_substat_values
+        if sub_values is None:
+            rarity = self.rarity
+            sub_values = MappingProxyType({sub.stat_type: sub.get_value(rarity) for sub in self.sub_stats})
+            self._cached_substat_values = sub_values
         return sub_values
 
+    def __setattr__(self, name, value):
+        """Override setattr to invalidate cached stat values when properties change."""
+        if name == "sub_stats" and type(value) is not tuple:
+            value = tuple(value) # Immutable, so in-place edits cannot bypass the cache invalidation
+        object.__setattr__(self, name, value)
+        if name in self._KEY_FIELDS and hasattr(self, '_cached_key'):
+            object.__setattr__(self, '_cached_key', None)
+            if name in self._STAT_AFFECTING_FIELDS:
+                object.__setattr__(self, '_cached_main_stat_value', None)
+                object.__setattr__(self, '_cached_substat_values', None)
+
     # --- Potential future method ---
     # def get_total_stats_contribution(self) -> 'Stats': # Assuming a Stats class exists
     #     """Combines main stat and substats into a single Stats object."""
@@ -1,5 +1,6 @@
 # core/drive_disc_set_data.py
 
+import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
@@ -7,8 +8,11 @@ from typing import Dict, List, Optional, Any
 # Adjust import path if needed
 from .common import Stat
 
+# Matches '{key}' placeholders in bonus descriptions
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
 
-@dataclass
+
+@dataclass(slots=True)
 class DriveDisc2PieceBonus:
     """Represents the data associated with a 2-piece set bonus effect."""
     simple_stat: Optional[Stat] = None
@@ -32,14 +36,16 @@ class DriveDisc2PieceBonus:
                 return cls(complex_stat=stat_str, value=value_val)
         except (ValueError, TypeError) as e:
             print(f"Warning: Could not parse 2-piece bonus data: {data}. Error: {e}")
-            return cls
+            return cls()
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveDisc4PieceBonus:
     """Represents the data associated with a 4-piece set bonus effect."""
     description: Optional[str] = None
     values: Dict[str, Any] = field(default_factory=dict)
+    # Formatted description, filled on the first get_formatted_description call
+    _formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional['DriveDisc4PieceBonus']:
@@ -64,23 +70,36 @@ class DriveDisc4PieceBonus:
     def get_formatted_description(self) -> Optional[str]:
         """
         Returns the bonus description string with placeholders formatted
-        using the 'values' dictionary.
+        using the 'values' dictionary. The result is cached on the instance;
+        reassigning description or values clears it, but editing the values
+        dict in place does not.
         """
+        if self._formatted is not None:
+            return self._formatted
         if self.description is None:
             return None
 
         try:
-            formatted_desc = self.description
-            for key, value in self.values.items():
-                placeholder = "{" + key + "}"
-                formatted_desc = formatted_desc.replace(placeholder, str(value))
+            # Single pass over the description; unknown placeholders are left as-is
+            values = self.values
+            formatted_desc = _PLACEHOLDER_RE.sub(
+                lambda match: str(values[match.group(1)]) if match.group(1) in values else match.group(0),
+                self.description
+            )
+            self._formatted = formatted_desc
             return formatted_desc
         except (KeyError, ValueError, TypeError) as e:
             print(f"Warning: Could not format description for 4-piece bonus. Error: {e}")
             return self.description
 
+    def __setattr__(self, name, value):
+        """Override setattr to invalidate the cached description when its inputs change."""
+        object.__setattr__(self, name, value)
+        if name == "description" or name == "values":
+            object.__setattr__(self, '_formatted', None)
+
 
-@dataclass
+@dataclass(slots=True, eq=False) # Compared and hashed by identity so equipped discs can be counted per set
 class DriveDiscSetData:
     """Represents all data for a single Drive Disc set."""
     name: str # The key from the top-level JSON (e.g., "Woodpecker Electro")
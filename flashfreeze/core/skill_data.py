@@ -1,17 +1,25 @@
 import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Optional, Any, Tuple, Type
 
-from .common import Attribute, SkillType
+from .common import EMPTY_MAPPING, Attribute, SkillType
 
 # --- Dataclasses for JSON structure ---
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScalingData:
     """Represents dmg_scaling or daze_scaling data."""
     step: float = 0.0
     level_1: float = 0.0
     level_16: float = 0.0
+    # Values for levels 0-16 (level 0 mirrors level 1), filled in __post_init__
+    _values: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        values = [self.level_1 + self.step * (level - 1) for level in range(17)]
+        values[0] = self.level_1
+        values[16] = self.level_16
+        object.__setattr__(self, '_values', tuple(values))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Optional['ScalingData']:
@@ -31,17 +39,18 @@ class ScalingData:
             return None
 
     def get_value_at_level(self, level: int) -> float:
-        """Calculates the scaling value at a specific level (1-16)."""
+        """Returns the scaling value at a specific level (1-16), linearly interpolated between levels 1 and 16."""
+        if type(level) is int and 0 <= level <= 16:
+            return self._values[level]
+        # Non-int levels (e.g. 2.5) and out-of-range levels skip the table
         if level <= 1:
             return self.level_1
         if level >= 16:
             return self.level_16
-        # Linear interpolation between level 1 and level 16
-        calculated_value = self.level_1 + self.step * (level - 1)
-        return calculated_value
+        return self.level_1 + self.step * (level - 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiplierData:
     """Represents data for a specific hit/multiplier within an ability."""
     dmg_tags: List[str] = field(default_factory=list)
@@ -86,7 +95,7 @@ class MultiplierData:
             return None
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillData:
     """Represents a single skill (e.g., Basic Attack, Ultimate)."""
     name: str
@@ -103,12 +112,14 @@ class SkillData:
         multipliers_dict = {}
         other_data_dict = {}
         desc = data.get("description")
+        parse_multiplier = MultiplierData.from_dict # Bound once for the loop below
 
+        # Single pass: scaling blocks become MultiplierData, everything else is kept raw
         for key, value in data.items():
             if key == "description":
                 continue
             if isinstance(value, dict) and ("dmg_scaling" in value or "daze_scaling" in value):
-                multiplier_obj = MultiplierData.from_dict(value)
+                multiplier_obj = parse_multiplier(value)
                 if multiplier_obj:
                     multipliers_dict[key] = multiplier_obj
             else:
@@ -121,7 +132,7 @@ class SkillData:
             other_data=other_data_dict
         )
 
-@dataclass
+@dataclass(slots=True)
 class AgentSkillData:
     """Represents the top-level structure holding all skill data for an agent."""
     core_skills: Dict[str, Any] = field(default_factory=dict)
@@ -134,7 +145,7 @@ class AgentSkillData:
             return None
 
         core_skills_data = data.get("Core Skill", {})
-        skills_data = data.get("Skills", {})
+        skills_data = data.get("Skills", EMPTY_MAPPING)
         parsed_skills = {}
 
         if isinstance(skills_data, dict):
@@ -1,11 +1,23 @@
 # core/w_engine_data.py
 
+import logging
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 
 from .common import Rarity, Stat, Specialty
 
-@dataclass
+_log = logging.getLogger(__name__)
+
+# Matches '{key}' placeholders in passive descriptions
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+# Passive 'values' keys indexed by phase (1-5), interned and hashed once instead of
+# building a fresh f-string per lookup
+_PHASE_KEYS = (None,) + tuple(sys.intern(f"phase_{phase}") for phase in range(1, 6))
+
+@dataclass(slots=True, frozen=True)
 class WEngineAdvancedStat:
     """Represents the advanced_stat block for a W-Engine."""
     stat: Stat = Stat.UNKNOWN
@@ -17,22 +29,27 @@ class WEngineAdvancedStat:
         if not isinstance(data, dict):
             return None # Return None if advanced_stat block is missing or not a dict
 
+        value = data.get("value", 0.0)
         try:
             return cls(
                 stat=Stat.from_string(data.get("stat", "")),
-                value=float(data.get("value", 0.0))
+                value=value if type(value) is float else float(value) # JSON floats need no conversion
             )
         except (ValueError, TypeError) as e:
-            print(f"Warning: Could not parse W-Engine advanced stat data: {data}. Error: {e}")
+            _log.warning("Could not parse W-Engine advanced stat data: %s. Error: %s", data, e)
             return None # Return None on parsing error
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WEnginePassive:
     """Represents the passive block for a W-Engine."""
     name: Optional[str] = None
     description: Optional[str] = None
     values: Dict[str, Any] = field(default_factory=dict)
+    # Formatted descriptions by phase, filled by get_formatted_description
+    _formatted: Dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Value key tuple, filled by get_value_keys
+    _value_keys: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional['WEnginePassive']:
@@ -51,36 +68,41 @@ class WEnginePassive:
         Helper method to get a specific passive value for a given phase/refinement (1-5).
         Example: get_passive_value(phase=1, value_key='physical_dmg') -> 20
         """
-        if not 1 <= phase <= 5:
-            print(f"Warning: Phase must be between 1 and 5, got {phase}.")
+        if type(phase) is not int or not 1 <= phase <= 5:
+            _log.warning("Phase must be an int between 1 and 5, got %s.", phase)
             return None
-        phase_key = f"phase_{phase}"
-        phase_data = self.values.get(phase_key)
+        phase_data = self.values.get(_PHASE_KEYS[phase])
         if isinstance(phase_data, dict):
             return phase_data.get(value_key)
         return None
 
-    def get_value_keys(self) -> List[str]:
+    def get_value_keys(self) -> Tuple[str, ...]:
         """
-        Returns a list of the value keys available in the passive scaling.
+        Returns a tuple of the value keys available in the passive scaling.
         Assumes all phases have the same keys and uses phase_1 to determine them.
-        Example: ['physical_dmg', 'back_dmg'] for Steel Cushion.
+        Example: ('physical_dmg', 'back_dmg') for Steel Cushion.
+        The tuple is built on first call and cached.
         """
+        if self._value_keys is not None:
+            return self._value_keys
         if not self.values:
-            return [] # Return empty list if no values data exists
+            return () # Return empty tuple if no values data exists
 
-        phase_1_data = self.values.get("phase_1")
+        phase_1_data = self.values.get(_PHASE_KEYS[1])
         if isinstance(phase_1_data, dict):
-            return list(phase_1_data.keys())
+            value_keys = tuple(phase_1_data)
+            object.__setattr__(self, '_value_keys', value_keys) # Frozen dataclass
+            return value_keys
         else:
             # Fallback or warning if phase_1 data is missing/invalid
-            print(f"Warning: Could not determine value keys from phase_1 data for passive '{self.name}'.")
-            return []
+            _log.warning("Could not determine value keys from phase_1 data for passive '%s'.", self.name)
+            return ()
 
     def get_formatted_description(self, phase: int) -> Optional[str]:
         """
         Returns the passive description string with placeholders formatted
-        using values from the specified phase (1-5).
+        using values from the specified phase (1-5). Results are cached per phase,
+        so description and values should not be changed after the first call.
 
         Args:
             phase: The refinement phase (1-5) to use for values.
@@ -93,35 +115,39 @@ class WEnginePassive:
         if self.description is None:
             return None # No description to format
 
-        if not 1 <= phase <= 5:
-            print(f"Warning: Phase must be between 1 and 5 for formatting, got {phase}.")
+        # Checked before the cache, where 2.0 would hit the entry for phase 2
+        if type(phase) is not int or not 1 <= phase <= 5:
+            _log.warning("Phase must be an int between 1 and 5 for formatting, got %s.", phase)
             return self.description # Return original description if phase is invalid
 
-        phase_key = f"phase_{phase}"
-        phase_data = self.values.get(phase_key)
+        formatted_desc = self._formatted.get(phase)
+        if formatted_desc is not None:
+            return formatted_desc
+
+        phase_data = self.values.get(_PHASE_KEYS[phase])
 
         if not isinstance(phase_data, dict):
             # Return original description if phase data is missing or not a dict
             return self.description
 
+        if "{" not in self.description:
+            return self.description # Nothing to substitute
+
         try:
-            # Using a loop and replace for robustness against missing keys:
-            formatted_desc = self.description
-            for key, value in phase_data.items():
-                 placeholder = "{" + key + "}" # Construct placeholder like {physical_dmg}
-                 # Convert value to string for replacement, handle potential formatting needs
-                 formatted_desc = formatted_desc.replace(placeholder, str(value))
+            # Single pass over the description; placeholders missing from phase_data are left as-is
+            formatted_desc = _PLACEHOLDER_RE.sub(
+                lambda match: str(phase_data[match.group(1)]) if match.group(1) in phase_data else match.group(0),
+                self.description
+            )
+            self._formatted[phase] = formatted_desc
             return formatted_desc
-            # Alternative using str.format(**kwargs) - might raise KeyError if description
-            # contains placeholders not present in phase_data keys.
-            # return self.description.format(**phase_data)
         except (KeyError, ValueError, TypeError) as e:
             # Handle potential errors during formatting (e.g., mismatched keys)
-            print(f"Warning: Could not format description for passive '{self.name}' phase {phase}. Error: {e}")
+            _log.warning("Could not format description for passive '%s' phase %s. Error: %s", self.name, phase, e)
             return self.description # Return original description on error
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WEngineData:
     """Represents all data for a single W-Engine."""
     name: str # The key from the top-level JSON (e.g., "Steel Cushion")
@@ -143,9 +169,9 @@ class WEngineData:
         base_atk_raw = data.get("base_atk")
         if base_atk_raw is not None:
             try:
-                base_atk_val = int(base_atk_raw)
+                base_atk_val = base_atk_raw if type(base_atk_raw) is int else int(base_atk_raw)
             except (ValueError, TypeError):
-                print(f"Warning: Could not convert base_atk '{base_atk_raw}' to int for W-Engine '{name}'.")
+                _log.warning("Could not convert base_atk '%s' to int for W-Engine '%s'.", base_atk_raw, name)
 
         return cls(
             name=name,
@@ -157,7 +183,7 @@ class WEngineData:
             passive=WEnginePassive.from_dict(data.get("passive")) # Pass the sub-dict directly
         )
     
-@dataclass
+@dataclass(slots=True)
 class WEngine:
     """Represents a specific W-Engine instance to be equipped by an agent."""
     # Static data for the W-Engine type
@@ -169,22 +195,35 @@ class WEngine:
 
     def __post_init__(self):
         """Validate level and phase."""
-        # Basic validation, assuming max level is 90 for W-Engines? Adjust if needed.
-        self.level = max(0, min(self.level, 60))
-        self.modification = max(0, min(self.modification, 5))
-        self.phase = max(1, min(self.phase, 5))
-
-        # Validate level based on modification
-        min_level = self.modification * 10
+        # Clamp with plain comparisons; this runs for every equipped W-Engine
+        modification = self.modification
+        if modification < 0:
+            modification = self.modification = 0
+        elif modification > 5:
+            modification = self.modification = 5
+        phase = self.phase
+        if phase < 1:
+            self.phase = 1
+        elif phase > 5:
+            self.phase = 5
+
+        level = self.level
+        if level < 0:
+            level = self.level = 0
+        elif level > 60:
+            level = self.level = 60
+
+        # Level must lie in the modification's 10-level band
+        min_level = modification * 10
         max_level = min_level + 10
-        if not (min_level <= self.level <= max_level):
-            print(f"Warning: Level {self.level} is out of range for modification {self.modification}. Adjusting.")
-            self.level = max(min_level, min(self.level, max_level))
+        if level < min_level or level > max_level:
+            _log.warning("Level %d is out of range for modification %d. Adjusting.", level, modification)
+            self.level = min_level if level < min_level else max_level
 
     def get_current_base_atk(self) -> int:
         """Gets the W-Engine's base ATK for its current level."""
         # TODO: Implement level scaling logic based on W-Engine data
-        print(f"Placeholder: Fetching W-Engine base ATK for level {self.level}. Using stored max value for now.")
+        _log.debug("Placeholder: Fetching W-Engine base ATK for level %d. Using stored max value for now.", self.level)
         return self.wengine_data.base_atk # Replace with actual level lookup
 
     def get_advanced_stat(self) -> Optional[tuple['Stat', float]]:
@@ -192,7 +231,7 @@ class WEngine:
         if self.wengine_data.advanced_stat:
             # Assuming WEngineData.advanced_stat stores the *max* level advanced stat value
             # A real implementation might need level scaling lookup here too.
-            print("Placeholder: Returning max level W-Engine advanced stat value.")
+            _log.debug("Placeholder: Returning max level W-Engine advanced stat value.")
             return (self.wengine_data.advanced_stat.stat, self.wengine_data.advanced_stat.value)
         return None
 
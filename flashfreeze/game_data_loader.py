@@ -1,9 +1,24 @@
 import json
+import logging
 import os
 from functools import lru_cache
-from typing import Dict, Any, Optional, List, Set
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Tuple
 
-from flashfreeze.core.common import Stat, Rarity
+from flashfreeze.core.common import EMPTY_MAPPING, Stat, Rarity
+from flashfreeze.core.w_engine_data import WEngineData
+
+if TYPE_CHECKING:
+    # Only for annotations; a runtime import would be circular (see get_agent)
+    from flashfreeze.core.agent_data import AgentData
+
+# Prefer orjson for parsing when it is installed; the stdlib parser is the fallback.
+# Both accept raw bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson as _json_parser
+except ImportError:
+    _json_parser = json
+
+_log = logging.getLogger(__name__)
 
 # Define the directory where your static JSON data is stored
 LOADER_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,6 +35,10 @@ ENEMIES_FILE = 'enemies.json'
 SKILLS_DIR = 'skills'
 ELLEN_SKILLS_FILE = os.path.join(SKILLS_DIR, 'ellen.json')
 
+W_ENGINE_MAX_LEVEL = 60
+DRIVE_DISC_MAX_LEVEL = 15
+
+
 # --- Private Helper Function with Caching ---
 
 @lru_cache(maxsize=None) # Cache results indefinitely
@@ -27,7 +46,8 @@ def _load_json_data(filename: str) -> Dict[str, Any]:
     """
     Loads and parses a JSON file from the STATIC_DATA_DIR.
     Handles file not found and JSON decoding errors.
-    Results are cached using lru_cache.
+    Results are cached using lru_cache, so every caller shares the same dict
+    and must not modify it.
 
     Args:
         filename: The name of the JSON file to load (e.g., 'w_engines.json').
@@ -38,21 +58,21 @@ def _load_json_data(filename: str) -> Dict[str, Any]:
     """
     filepath = os.path.join(STATIC_DATA_DIR, filename)
     try:
-        # Ensure UTF-8 encoding is used for broader compatibility
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Read raw bytes; JSON is UTF-8 and both parsers decode it themselves
+        with open(filepath, 'rb') as f:
+            data = _json_parser.loads(f.read())
             if not isinstance(data, dict):
-                print(f"Warning: Root element in {filename} is not a dictionary.")
+                _log.warning("Root element in %s is not a dictionary.", filename)
                 return {}
             return data
     except FileNotFoundError:
-        print(f"Error: Static data file not found at {filepath}")
+        _log.error("Static data file not found at %s", filepath)
         return {}
     except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from {filepath}")
+        _log.error("Could not decode JSON from %s", filepath)
         return {}
     except Exception as e:
-        print(f"An unexpected error occurred loading {filepath}: {e}")
+        _log.error("An unexpected error occurred loading %s: %s", filepath, e)
         return {}
 
 # --- Public Data Access Functions ---
@@ -70,15 +90,34 @@ def get_w_engine_data(engine_name: str) -> Optional[Dict[str, Any]]:
     all_engines = _load_json_data(W_ENGINES_FILE)
     return all_engines.get(engine_name)
 
-def get_all_w_engine_names() -> List[str]:
-    """Returns a list of all W-Engine names."""
+@lru_cache(maxsize=None) # Static data, so each W-Engine is parsed once
+def get_w_engine(engine_name: str) -> Optional[WEngineData]:
+    """
+    Retrieves a specific W-Engine by its name, parsed into a WEngineData object.
+    The same instance is returned on every call, so callers must not modify it.
+
+    Args:
+        engine_name: The name (key) of the W-Engine.
+
+    Returns:
+        The W-Engine's WEngineData, or None if not found.
+    """
+    engine_dict = get_w_engine_data(engine_name)
+    if engine_dict is None:
+        return None
+    return WEngineData.from_dict(engine_name, engine_dict)
+
+@lru_cache(maxsize=None) # Static data, so the tuple is built once
+def get_all_w_engine_names() -> Tuple[str, ...]:
+    """Returns a tuple of all W-Engine names."""
     all_engines = _load_json_data(W_ENGINES_FILE)
-    return list(all_engines.keys())
+    return tuple(all_engines.keys())
 
-def get_all_agent_names() -> List[str]:
-    """Returns a list of all Agent names."""
+@lru_cache(maxsize=None) # Static data, so the tuple is built once
+def get_all_agent_names() -> Tuple[str, ...]:
+    """Returns a tuple of all Agent names."""
     all_agents = _load_json_data(AGENTS_FILE)
-    return list(all_agents.keys())
+    return tuple(all_agents.keys())
 
 def get_agent_data(agent_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -93,6 +132,26 @@ def get_agent_data(agent_name: str) -> Optional[Dict[str, Any]]:
     agent_dict = _load_json_data(AGENTS_FILE)
     return agent_dict.get(agent_name)
 
+@lru_cache(maxsize=None) # Static data, so each Agent is parsed once
+def get_agent(agent_name: str) -> Optional['AgentData']:
+    """
+    Retrieves an Agent by its name, parsed into an AgentData object.
+    The same frozen instance is returned on every call.
+
+    Args:
+        agent_name: The desired Agent's name.
+
+    Returns:
+        The Agent's AgentData, or None if not found.
+    """
+    # Imported here: agent_data imports drive_disc_data, which imports this module
+    from flashfreeze.core.agent_data import AgentData
+
+    agent_dict = get_agent_data(agent_name)
+    if agent_dict is None:
+        return None
+    return AgentData.from_dict(agent_name, agent_dict)
+
 def get_agent_skill_data(agent_filename: str) -> Optional[Dict[str, Any]]:
     """
     Retrieves data for an Agent's skillset by its name.
@@ -120,6 +179,39 @@ def get_drive_disc_set_data(set_name: str) -> Optional[Dict[str, Any]]:
     all_sets = _load_json_data(DRIVE_DISCS_SETS_FILE)
     return all_sets.get(set_name)
 
+@lru_cache(maxsize=None) # Static table, so it is parsed once
+def _get_drive_main_stat_table() -> Tuple[Tuple[Tuple[Optional[float], ...], ...], ...]:
+    """
+    Parses the Drive Disc main stat file into nested tuples indexed by
+    [Stat.index][Rarity.index][level] for levels 0-15, with None where the
+    JSON has no (valid) value. All damage bonus stats share the "DMG" entry.
+    """
+    all_main_stats = _load_json_data(DRIVE_DISCS_MAIN_STATS_FILE)
+    damage_bonus_stats = Stat.get_damage_bonus_stats()
+    levels = range(DRIVE_DISC_MAX_LEVEL + 1)
+
+    table = []
+    for stat_type in Stat:
+        # Use Enum values for keys (e.g., "HP%", "S")
+        stat_key = "DMG" if stat_type in damage_bonus_stats else stat_type.value
+        stat_data = all_main_stats.get(stat_key, EMPTY_MAPPING)
+        rarity_rows = []
+        for rarity in Rarity:
+            rarity_data = stat_data.get(rarity.value, EMPTY_MAPPING)
+            level_values = []
+            for level in levels:
+                raw_value = rarity_data.get(str(level))
+                value = None
+                if raw_value is not None:
+                    try:
+                        value = float(raw_value)
+                    except (ValueError, TypeError):
+                        _log.warning("Could not convert main stat value '%s' to float for %s/%s/%d", raw_value, stat_key, rarity.value, level)
+                level_values.append(value)
+            rarity_rows.append(tuple(level_values))
+        table.append(tuple(rarity_rows))
+    return tuple(table)
+
 def get_drive_main_stat_value(rarity: Rarity, stat_type: Stat, level: int) -> Optional[float]:
     """
     Retrieves the main stat value for a Drive Disc.
@@ -134,31 +226,36 @@ def get_drive_main_stat_value(rarity: Rarity, stat_type: Stat, level: int) -> Op
         or None if the value for the specific stat/rarity/level combination
         is not found in the JSON.
     """
-    all_main_stats = _load_json_data(DRIVE_DISCS_MAIN_STATS_FILE)
-
-    # Use Enum values for keys (e.g., "HP%", "S")
-    if stat_type in Stat.get_damage_bonus_stats():
-        stat_key = "DMG"
-    else:
-        stat_key = stat_type.value
-    rarity_key = rarity.value # Assumes Rarity enum values are "S", "A", "B"
-    level_key = str(level)
-
-    # Navigate the dictionary safely using .get()
-    stat_data = all_main_stats.get(stat_key, {})
-    rarity_data = stat_data.get(rarity_key, {})
-    raw_value = rarity_data.get(level_key)
-
-    if raw_value is None:
-        # Value for this specific level not found
+    if not 0 <= level <= DRIVE_DISC_MAX_LEVEL:
         # Could add interpolation later if needed
         return None
+    # Indexed by member index rather than keyed by enum, which would hash in Python code
+    return _get_drive_main_stat_table()[stat_type.index][rarity.index][level]
 
-    try:
-        return float(raw_value)
-    except (ValueError, TypeError):
-        print(f"Warning: Could not convert main stat value '{raw_value}' to float for {stat_key}/{rarity_key}/{level_key}")
-        return None
+@lru_cache(maxsize=None) # Static table, so it is parsed once
+def _get_drive_substat_table() -> Tuple[Tuple[Optional[float], ...], ...]:
+    """
+    Parses the Drive Disc substat file into nested tuples indexed by
+    [Stat.index][Rarity.index], with None where the JSON has no (valid) value.
+    """
+    all_sub_stats = _load_json_data(DRIVE_DISCS_SUB_STATS_FILE)
+
+    table = []
+    for stat_type in Stat:
+        # Use Enum values for keys (e.g., "HP%", "S")
+        stat_data = all_sub_stats.get(stat_type.value, EMPTY_MAPPING)
+        rarity_values = []
+        for rarity in Rarity:
+            raw_value = stat_data.get(rarity.value)
+            value = None
+            if raw_value is not None:
+                try:
+                    value = float(raw_value)
+                except (ValueError, TypeError):
+                    _log.warning("Could not convert substat value '%s' to float for %s/%s", raw_value, stat_type.value, rarity.value)
+            rarity_values.append(value)
+        table.append(tuple(rarity_values))
+    return tuple(table)
 
 def get_drive_substat_base_value(rarity: Rarity, stat_type: Stat) -> Optional[float]:
     """
@@ -173,24 +270,7 @@ def get_drive_substat_base_value(rarity: Rarity, stat_type: Stat) -> Optional[fl
         or None if the value for the specific stat/rarity combination
         is not found in the JSON.
     """
-    all_sub_stats = _load_json_data(DRIVE_DISCS_SUB_STATS_FILE)
-
-    # Use Enum values for keys (e.g., "HP%", "S")
-    stat_key = stat_type.value
-    rarity_key = rarity.value # Assumes Rarity enum values are "S", "A", "B"
-
-    # Navigate safely
-    stat_data = all_sub_stats.get(stat_key, {})
-    raw_value = stat_data.get(rarity_key)
-
-    if raw_value is None:
-        return None
-
-    try:
-        return float(raw_value)
-    except (ValueError, TypeError):
-        print(f"Warning: Could not convert substat value '{raw_value}' to float for {stat_key}/{rarity_key}")
-        return None
+    return _get_drive_substat_table()[stat_type.index][rarity.index]
 
 def get_enemy_data(enemy_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -208,6 +288,34 @@ def get_enemy_data(enemy_name: str) -> Optional[Dict[str, Any]]:
 # --- Potentially More Complex Access Logic ---
 # Example: Getting a W-Engine's base ATK at a specific level
 
+@lru_cache(maxsize=None) # Static data, so each engine's scaling is parsed once
+def _get_w_engine_base_atk_table(engine_name: str) -> Optional[Tuple[Optional[float], ...]]:
+    """
+    Parses a W-Engine's 'base_atk_scaling' dictionary into a tuple indexed by
+    level (0-60), with None for levels that are missing or have invalid values.
+    Returns None if the engine or its scaling data is missing.
+    """
+    engine_data = get_w_engine_data(engine_name)
+    if not engine_data:
+        return None
+
+    scaling_data = engine_data.get('base_atk_scaling')
+    if not isinstance(scaling_data, dict):
+        _log.warning("Missing or invalid 'base_atk_scaling' for %s", engine_name)
+        return None
+
+    table: List[Optional[float]] = [None] * (W_ENGINE_MAX_LEVEL + 1)
+    for level in range(W_ENGINE_MAX_LEVEL + 1):
+        # Levels in JSON are string keys
+        base_atk = scaling_data.get(str(level))
+        if base_atk is None:
+            continue
+        try:
+            table[level] = float(base_atk)
+        except (ValueError, TypeError):
+            _log.warning("Invalid base ATK value '%s' for %s at level %d", base_atk, engine_name, level)
+    return tuple(table)
+
 def get_w_engine_stats(engine_name: str, level: int) -> Optional[float]:
     """
     Gets the base ATK for a W-Engine at a specific level.
@@ -221,30 +329,18 @@ def get_w_engine_stats(engine_name: str, level: int) -> Optional[float]:
     Returns:
         The base ATK as a float, or None if data is missing/invalid.
     """
-    engine_data = get_w_engine_data(engine_name)
-    if not engine_data:
-        return None
-
-    scaling_data = engine_data.get('base_atk_scaling')
-    if not isinstance(scaling_data, dict):
-        print(f"Warning: Missing or invalid 'base_atk_scaling' for {engine_name}")
+    table = _get_w_engine_base_atk_table(engine_name)
+    if table is None:
         return None
 
-    # Levels in JSON might be strings, convert level to string for lookup
-    level_str = str(level)
-    base_atk = scaling_data.get(level_str)
-
+    base_atk = table[level] if 0 <= level <= W_ENGINE_MAX_LEVEL else None
     if base_atk is None:
         # Optional: Add interpolation logic here if needed for levels
         # not explicitly listed in the JSON. For now, return None.
-        print(f"Warning: Level {level} not found in 'base_atk_scaling' for {engine_name}")
+        _log.warning("Level %s not found in 'base_atk_scaling' for %s", level, engine_name)
         return None
 
-    try:
-        return float(base_atk)
-    except (ValueError, TypeError):
-        print(f"Warning: Invalid base ATK value '{base_atk}' for {engine_name} at level {level}")
-        return None
+    return base_atk
 
 # Add similar specific accessor functions as needed for other data types
 # (e.g., getting skill multipliers, passive effects based on refinement, etc.)
@@ -0,0 +1,120 @@
+# tests/conftest.py
+
+import pytest
+from typing import Dict, Any, Optional, List, Tuple
+
+from flashfreeze.core.drive_disc_set_data import DriveDiscSetData, DriveDisc2PieceBonus, DriveDisc4PieceBonus
+from flashfreeze.core.skill_data import AgentSkillData, MultiplierData
+from flashfreeze.core.w_engine_data import WEngineData, WEnginePassive
+from flashfreeze import game_data_loader as gdl
+
+# --- Test Data Fixtures ---
+
+@pytest.fixture(scope="session")
+def woodpecker_dict() -> Dict[str, Any]:
+    """Raw dictionary data for Woodpecker Electro Drive Disc set."""
+    return {
+        "2-piece": {
+            "stat": "CRIT Rate",
+            "value": 0.08
+        },
+        "4-piece": {
+            "description": "Landing a critical hit on an enemy with a Basic Attack, Dodge Counter, or EX Special Attack increases the equipper's ATK by {atk}% for {duration}s. The buff duration for different skills are calculated separately.",
+            "values": {
+                "atk": 9,
+                "duration": 6
+            }
+        }
+    }
+
+# Fixture for a valid, parsed DriveDiscSetData object
+@pytest.fixture(scope="session")
+def woodpecker_obj(woodpecker_dict) -> Optional[DriveDiscSetData]:
+    """Parsed DriveDiscSetData object for Woodpecker Electro."""
+    obj = DriveDiscSetData.from_dict("Woodpecker Electro", woodpecker_dict)
+    assert obj is not None, "Failed to parse woodpecker_dict fixture"
+    return obj
+
+# Fixture for the 2pc bonus object, useful for method testing
+@pytest.fixture(scope="session")
+def woodpecker_2pc_bonus_obj(woodpecker_obj) -> Optional[DriveDisc2PieceBonus]:
+    """Parsed DriveDisc2PieceBonus object for Woodpecker 2pc."""
+    assert woodpecker_obj is not None, "Dependency fixture woodpecker_obj failed"
+    return woodpecker_obj.bonus_2pc
+
+# Fixture for the 4pc bonus object, useful for method testing
+@pytest.fixture(scope="session")
+def woodpecker_4pc_bonus_obj(woodpecker_obj) -> Optional[DriveDisc4PieceBonus]:
+    """Parsed DriveDisc4PieceBonus object for Woodpecker 4pc."""
+    assert woodpecker_obj is not None, "Dependency fixture woodpecker_obj failed"
+    return woodpecker_obj.bonus_4pc
+
+@pytest.fixture(scope="session")
+def steel_cushion_dict() -> Dict[str, Any]:
+    """Raw dictionary data for Steel Cushion W-Engine."""
+    return {
+        "specialty": "attack", # Use lowercase as in original JSON example
+        "rarity": "S",
+        "base_atk": "684",
+        "advanced_stat": {
+            "stat": "CRIT Rate",
+            "value": 0.24
+        },
+        "passive": {
+            "name": "Metal Cat Claws",
+            "description": "Increases Physical DMG by {physical_dmg}%. The equipper's DMG increases by {back_dmg}% when hitting the enemy from behind.",
+            "values": {
+                "phase_1": {"physical_dmg": 20, "back_dmg": 25},
+                "phase_2": {"physical_dmg": 25, "back_dmg": 31.5},
+                "phase_3": {"physical_dmg": 30, "back_dmg": 38},
+                "phase_4": {"physical_dmg": 35, "back_dmg": 44},
+                "phase_5": {"physical_dmg": 40, "back_dmg": 50}
+            }
+        }
+    }
+
+# Fixture for a valid, parsed WEngineData object
+@pytest.fixture(scope="session")
+def steel_cushion_obj(steel_cushion_dict) -> Optional[WEngineData]:
+    """Parsed WEngineData object for Steel Cushion."""
+    obj = WEngineData.from_dict("Steel Cushion", steel_cushion_dict)
+    assert obj is not None, "Failed to parse steel_cushion_dict fixture"
+    return obj
+
+# Fixture for just the passive object, useful for method testing
+@pytest.fixture(scope="session")
+def steel_cushion_passive_obj(steel_cushion_obj) -> Optional[WEnginePassive]:
+    """Parsed WEnginePassive object for Steel Cushion."""
+    assert steel_cushion_obj is not None, "Dependency fixture steel_cushion_obj failed"
+    return steel_cushion_obj.passive
+
+# Formatted passive descriptions for phases 1-5, built once from the shared passive
+@pytest.fixture(scope="session")
+def formatted_descriptions(steel_cushion_passive_obj) -> Dict[int, Optional[str]]:
+    """Steel Cushion passive description formatted for each phase."""
+    assert steel_cushion_passive_obj is not None, "Dependency fixture steel_cushion_passive_obj failed"
+    return {phase: steel_cushion_passive_obj.get_formatted_description(phase) for phase in range(1, 6)}
+
+# Never mutated by the tests, so one instance is shared by the whole session
+@pytest.fixture(scope="session")
+def dummy_set_data() -> DriveDiscSetData:
+    """ Provides a basic DriveDiscSetData instance for tests. """
+    # Parsing logic is tested elsewhere, just need a valid object structure
+    return DriveDiscSetData(name="Test Set")
+
+@pytest.fixture(scope="session") # Load skills data once per test session
+def all_skills_data() -> AgentSkillData:
+    """Fixture to load skills data from JSON."""
+    data = AgentSkillData.from_dict(gdl.get_agent_skill_data(gdl.ELLEN_SKILLS_FILE))
+    if not data:
+        pytest.fail(f"Failed to load required test data from {gdl.ELLEN_SKILLS_FILE}")
+    return data
+
+@pytest.fixture(scope="session")
+def flat_multipliers(all_skills_data) -> List[Tuple[str, str, MultiplierData]]:
+    """(skill name, multiplier name, MultiplierData) for every multiplier, flattened once."""
+    return [
+        (skill_name, multiplier_name, multiplier_obj)
+        for skill_name, skill_obj in all_skills_data.skills.items()
+        for multiplier_name, multiplier_obj in skill_obj.multipliers.items()
+    ]
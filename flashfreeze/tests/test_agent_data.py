@@ -1,4 +1,7 @@
 import pytest
+from dataclasses import fields
+from flashfreeze.core.drive_disc_data import DriveDisc
+from flashfreeze.core.drive_disc_set_data import DriveDiscSetData, DriveDisc2PieceBonus
 from flashfreeze.core.common import Stat, Attribute, Specialty, Faction, Rarity, SkillType, AttackType
 
 from flashfreeze.core.agent_data import (
@@ -41,6 +44,22 @@ def test_agent_base_stats_from_dict():
     assert base_stats.crit_dmg == 75.0
 
 
+def test_agent_base_stats_from_dict_defaults():
+    base_stats = AgentBaseStats.from_dict({})
+    assert base_stats.hp == 0
+    assert base_stats.pen_ratio == 0.0
+    assert base_stats.energy_regen == 1.2
+    assert base_stats.energy_limit == 120
+    assert base_stats.crit_rate == 5.0
+    assert base_stats.crit_dmg == 50.0
+
+
+def test_agent_base_stats_from_dict_invalid_shares_default():
+    default = AgentBaseStats.from_dict(None)
+    assert default == AgentBaseStats()
+    assert AgentBaseStats.from_dict({"base_hp": "not a number"}) is default
+
+
 def test_agent_core_stat_from_dict():
     data = {"stat": "ATK", "value": 25.0}
     core_stat = AgentCoreStat.from_dict(data)
@@ -80,6 +99,8 @@ def test_agent_data_from_dict():
     assert agent_data.specialty == Specialty.ATTACK
     assert agent_data.faction == Faction.VICTORIA_HOUSEKEEPING_CO
     assert agent_data.type == [AttackType.SLASH]
+    assert agent_data.has_type(AttackType.SLASH)
+    assert not agent_data.has_type(AttackType.STRIKE)
     assert agent_data.rarity == Rarity.S
     assert agent_data.info.full_name == "Ellen Joe"
     assert agent_data.info.gender == "Female"
@@ -95,6 +116,23 @@ def test_agent_data_from_dict():
     assert agent_data.core_stat.value == 4.8
 
 
+def test_agent_data_type_mask():
+    agent_data = AgentData.from_dict("Test", {"type": ["Pierce", "strike", "Not A Type"]})
+    assert agent_data.type_mask == AttackType.STRIKE.bit | AttackType.PIERCE.bit
+    assert agent_data.type == [AttackType.STRIKE, AttackType.PIERCE]
+    assert not agent_data.has_type(AttackType.UNKNOWN)
+    assert AgentData(name="Empty").type == []
+
+
+def test_agent_data_from_dict_missing_blocks():
+    """Test missing nested blocks parse like empty ones, keeping the game defaults."""
+    agent_data = AgentData.from_dict("Test", {})
+    assert agent_data.info == AgentInfo.from_dict({})
+    assert agent_data.base_stats == AgentBaseStats.from_dict({})
+    assert agent_data.base_stats.energy_limit == 120
+    assert agent_data.core_stat == AgentCoreStat.from_dict({})
+
+
 def test_agent_bonus_stats_add_stat():
     bonus_stats = AgentBonusStats()
     bonus_stats.add_stat(Stat.HP, 500)
@@ -103,6 +141,15 @@ def test_agent_bonus_stats_add_stat():
     assert bonus_stats.atk_percent == 10.0
 
 
+def test_agent_bonus_stats_add_stat_covers_all_stats():
+    bonus_stats = AgentBonusStats()
+    for stat in Stat:
+        if stat != Stat.UNKNOWN:
+            bonus_stats.add_stat(stat, 1.5)
+    for stat_field in fields(AgentBonusStats):
+        assert getattr(bonus_stats, stat_field.name) in (1, 1.5), stat_field.name
+
+
 def test_agent_total_stats_from_base_and_bonus():
     base_stats = AgentBaseStats(hp=1000, atk=200, defense=150)
     bonus_stats = AgentBonusStats(hp=500, atk_percent=10.0, def_percent=20.0)
@@ -112,6 +159,36 @@ def test_agent_total_stats_from_base_and_bonus():
     assert total_stats.defense == 180
 
 
+def test_agent_total_stats_from_base_and_bonus_field_order():
+    base_stats = AgentBaseStats(crit_rate=5.0, crit_dmg=50.0, anomaly_proficiency=90, energy_regen=1.2, energy_limit=120)
+    bonus_stats = AgentBonusStats(
+        crit_rate=24.0, crit_dmg=48.0, anomaly_proficiency=92, pen_ratio=24.0, pen=9,
+        energy_regen_percent=50.0, energy_limit=20, physical_dmg=1.0, fire_dmg=2.0,
+        ice_dmg=3.0, electric_dmg=4.0, ether_dmg=5.0,
+    )
+    total_stats = AgentTotalStats.from_base_and_bonus(base_stats, bonus_stats)
+    assert total_stats.crit_rate == 29.0
+    assert total_stats.crit_dmg == 98.0
+    assert total_stats.anomaly_proficiency == 182
+    assert total_stats.pen_ratio == 24.0
+    assert total_stats.pen == 9
+    assert total_stats.energy_regen == pytest.approx(1.8)
+    assert total_stats.energy_limit == 140
+    assert (total_stats.physical_dmg, total_stats.fire_dmg, total_stats.ice_dmg,
+            total_stats.electric_dmg, total_stats.ether_dmg) == (1.0, 2.0, 3.0, 4.0, 5.0)
+
+
+def test_agent_total_stats_from_base_and_bonus_batch():
+    base_stats = AgentBaseStats(hp=1000, atk=200, defense=150, crit_rate=5.0, energy_regen=1.2)
+    bonus_list = [
+        AgentBonusStats(hp=500, atk_percent=10.0, def_percent=20.0),
+        AgentBonusStats(atk=316, crit_rate=24.0, energy_regen_percent=20.0, ice_dmg=30.0),
+        AgentBonusStats(),
+    ]
+    batch = AgentTotalStats.from_base_and_bonus_batch(base_stats, bonus_list)
+    assert batch == [AgentTotalStats.from_base_and_bonus(base_stats, bonus) for bonus in bonus_list]
+
+
 def test_agent_initialization():
     base_stats = AgentBaseStats(hp=1000, atk=200, defense=150)
     core_stat = AgentCoreStat(stat=Stat.ATK, value=25.0)
@@ -126,6 +203,16 @@ def test_agent_initialization():
     assert agent.total_stats.hp == 1000  # Base stats only for now
 
 
+def test_agent_total_stats_computed_lazily():
+    agent_data = AgentData(name="Ellen", base_stats=AgentBaseStats(hp=1000, atk=200))
+    agent = Agent(base_agent_data=agent_data, level=15, promotion=1)
+    assert agent._cached_total_stats is None
+    assert agent.total_stats.atk == 200
+    agent.skill_levels = {SkillType.CORE_SKILL: 2}
+    assert agent._cached_total_stats is None  # Invalidated by assignment
+    assert agent.total_stats.atk == 225
+
+
 def test_agent_recalculate_total_stats():
     base_stats = AgentBaseStats(hp=1000, atk=200, defense=150, crit_rate=5.0)
     core_stat = AgentCoreStat(stat=Stat.CRIT_RATE, value=4.8)
@@ -140,4 +227,20 @@ def test_agent_recalculate_total_stats():
     # Recalculate twice to ensure core stat only applies once
     agent.recalculate_total_stats()
     assert agent.total_stats.atk == 225  # Includes core stat bonus
-    assert agent.total_stats.crit_rate == pytest.approx(14.6)
\ No newline at end of file
+    assert agent.total_stats.crit_rate == pytest.approx(14.6)
+
+def test_agent_drive_disc_set_bonus():
+    set_a = DriveDiscSetData(name="Set A", bonus_2pc=DriveDisc2PieceBonus(simple_stat=Stat.ATK_PERCENT, value=10.0))
+    set_b = DriveDiscSetData(name="Set B")
+    agent_data = AgentData(name="Ellen", base_stats=AgentBaseStats(hp=1000, atk=1000))
+    agent = Agent(
+        base_agent_data=agent_data,
+        drive_discs={
+            1: DriveDisc(set_data=set_a, rarity=Rarity.S, level=15, slot=1, main_stat_type=Stat.HP),
+            2: DriveDisc(set_data=set_a, rarity=Rarity.S, level=15, slot=2, main_stat_type=Stat.ATK),
+            3: DriveDisc(set_data=set_b, rarity=Rarity.S, level=15, slot=3, main_stat_type=Stat.DEF),
+        },
+    )
+    assert agent.get_active_set_counts() == {set_a: 2, set_b: 1}
+    assert agent.total_stats.hp == 3200  # 1000 + 2200 main stat
+    assert agent.total_stats.atk == 1416  # 1000 * 1.10 (2pc) + 316 main stat
@@ -0,0 +1,32 @@
+# tests/test_common.py
+
+import pytest
+
+from flashfreeze.core.common import EMPTY_MAPPING, Stat, Rarity, Faction, AttackType
+
+
+@pytest.mark.parametrize("enum_cls, value, expected", [
+    (Stat, "ATK%", Stat.ATK_PERCENT),
+    (Stat, "crit rate", Stat.CRIT_RATE),    # Case-insensitive
+    (Stat, "Not A Stat", Stat.UNKNOWN),
+    (Stat, "", Stat.UNKNOWN),
+    (Rarity, "s", Rarity.S),
+    (Faction, "Victoria Housekeeping Co.", Faction.VICTORIA_HOUSEKEEPING_CO),
+    (AttackType, "SLASH", AttackType.SLASH),
+])
+def test_string_enum_from_string(enum_cls, value, expected):
+    """Test StringEnum.from_string lookups, including unknown values."""
+    assert enum_cls.from_string(value) is expected
+
+
+@pytest.mark.parametrize("enum_cls", [Stat, Rarity, Faction, AttackType])
+def test_string_enum_index(enum_cls):
+    """Test every member gets a dense index matching definition order."""
+    assert [member.index for member in enum_cls] == list(range(len(enum_cls)))
+
+
+def test_empty_mapping_is_read_only():
+    """Test the shared empty default rejects mutation."""
+    assert len(EMPTY_MAPPING) == 0
+    with pytest.raises(TypeError):
+        EMPTY_MAPPING["key"] = 1
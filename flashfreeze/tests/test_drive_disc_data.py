@@ -1,24 +1,41 @@
 # tests/test_drive_disc_data.py
 
 import pytest
-import os
-import sys
-from unittest.mock import patch, MagicMock
+import logging
+import re
+from unittest.mock import patch
 
-from flashfreeze.core.drive_disc_data import DriveDisc, SubStatInstance
+from flashfreeze.core.drive_disc_data import DriveDisc, SubStatInstance, _warn_missing_substat_base
 from flashfreeze.core.drive_disc_set_data import DriveDiscSetData # Needed for EquippedDriveDisc
 from flashfreeze.core.common import Stat, Rarity
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def mock_gdl():
-    """ Mocks the game_data_loader module for isolated testing. """
-    # Create a mock object that mimics the gdl module
-    mock_gdl_obj = MagicMock()
+class _FakeGDL:
+    """ Stands in for the game_data_loader module, serving drive disc values from fixed tables. """
+    def __init__(self, substat_base_values, main_stat_values):
+        self._substat_base_values = substat_base_values
+        self._main_stat_values = main_stat_values
+        # Lookup counters, for tests that check values are cached
+        self.substat_calls = 0
+        self.main_stat_calls = 0
+
+    def get_drive_substat_base_value(self, rarity, stat_type):
+        self.substat_calls += 1
+        return self._substat_base_values.get((rarity, stat_type)) # Return None if not found
 
-    # --- Mock get_drive_substat_base_value ---
+    def get_drive_main_stat_value(self, rarity, stat_type, level):
+        self.main_stat_calls += 1
+        return self._main_stat_values.get((rarity, stat_type, level)) # Return None if not found
+
+@pytest.fixture(scope="module")
+def mock_gdl():
+    """
+    Mocks the game_data_loader module for isolated testing.
+    Module-scoped: the value tables are never mutated, so one patch serves every test here.
+    """
+    # --- Values for get_drive_substat_base_value ---
     # Define return values for specific inputs we'll use in tests
     substat_base_values = {
         (Rarity.S, Stat.ATK_PERCENT): 0.03,
@@ -26,11 +43,8 @@ def mock_gdl():
         (Rarity.A, Stat.HP): 79.0,
         (Rarity.B, Stat.DEF): 5.0,
     }
-    def mock_get_substat_base(rarity, stat_type):
-        return substat_base_values.get((rarity, stat_type)) # Return None if not found
-    mock_gdl_obj.get_drive_substat_base_value = MagicMock(side_effect=mock_get_substat_base)
 
-    # --- Mock get_drive_main_stat_value ---
+    # --- Values for get_drive_main_stat_value ---
     main_stat_values = {
         # (Rarity, Stat, Level): Value
         (Rarity.S, Stat.ATK_PERCENT, 15): 0.30,
@@ -41,21 +55,19 @@ def mock_gdl():
         # Add case for missing level 5, but existing level 15 (max for S)
         (Rarity.S, Stat.CRIT_RATE, 15): 0.24,
     }
-    def mock_get_main_stat(rarity, stat_type, level):
-        return main_stat_values.get((rarity, stat_type, level)) # Return None if not found
-    mock_gdl_obj.get_drive_main_stat_value = MagicMock(side_effect=mock_get_main_stat)
+    fake_gdl = _FakeGDL(substat_base_values, main_stat_values)
 
     # Use patch to replace the actual gdl module within the test's scope
     # Adjust the target path ('flashfreeze.core.drive_disc_data.gdl') if your
     # import in drive_disc_data.py is different (e.g., 'zzzdata.game_data_loader')
-    with patch('flashfreeze.core.drive_disc_data.gdl', mock_gdl_obj):
-        yield mock_gdl_obj # Provide the mock to the test function if needed
+    with patch('flashfreeze.core.drive_disc_data.gdl', fake_gdl):
+        yield fake_gdl # Provide the fake to the test function if needed
 
 @pytest.fixture
-def dummy_set_data() -> DriveDiscSetData:
-    """ Provides a basic DriveDiscSetData instance for tests. """
-    # Parsing logic is tested elsewhere, just need a valid object structure
-    return DriveDiscSetData(name="Test Set")
+def baseline_kwargs(dummy_set_data) -> dict:
+    """ Constructor kwargs for a valid S-rank slot 4 disc; tests override individual fields. """
+    return dict(set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
+                main_stat_type=Stat.ATK_PERCENT, sub_stats=[])
 
 
 # --- Tests for SubStatInstance ---
@@ -70,116 +82,64 @@ def dummy_set_data() -> DriveDiscSetData:
     (Rarity.B, Stat.DEF, 2, 15.0),      # base(5) * (2+1)
     # Test case where base value is not found in mock
     (Rarity.S, Stat.HP, 0, 0.0),           # Base value for HP S not mocked -> None -> 0.0
-    # Test rolls exceeding max (should clamp to max)
-    (Rarity.S, Stat.ATK_PERCENT, 6, 0.18),    # 6 rolls treated as 5 (base * 6)
-])
+], ids=lambda v: getattr(v, "name", None)) # Enum members by name, e.g. "S-ATK_PERCENT-0-0.03"
 def test_substatinstance_get_value(rarity, stat_type, rolls, expected_value):
     """Test SubStatInstance.get_value calculation using mocked base values."""
     substat = SubStatInstance(stat_type=stat_type, rolls=rolls)
     value = substat.get_value(rarity)
     assert value == pytest.approx(expected_value)
 
+@pytest.mark.parametrize("rolls", [6, -1])
+def test_substatinstance_invalid_rolls(rolls):
+    """Test SubStatInstance rejects roll counts outside 0-MAX_SUBSTAT_ROLLS."""
+    with pytest.raises(ValueError, match=re.escape(f"Invalid number of rolls ({rolls})")):
+        SubStatInstance(stat_type=Stat.ATK_PERCENT, rolls=rolls)
+
+@pytest.mark.usefixtures("mock_gdl")
+def test_substatinstance_missing_base_value_logged_once(caplog):
+    """Test a missing substat base value is logged once, not on every lookup."""
+    _warn_missing_substat_base.cache_clear()
+    substat = SubStatInstance(stat_type=Stat.HP, rolls=0)
+    with caplog.at_level(logging.WARNING, logger="flashfreeze.core.drive_disc_data"):
+        for _ in range(3):
+            assert substat.get_value(Rarity.S) == 0.0
+    assert len(caplog.records) == 1
+    assert "HP" in caplog.records[0].getMessage()
+
 # --- Tests for EquippedDriveDisc ---
 
 # Test __post_init__ Validations
-def test_equipped_disc_post_init_valid(dummy_set_data):
-    """Test successful creation with valid parameters."""
-    try:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[
-                SubStatInstance(Stat.CRIT_RATE, 2),
-                SubStatInstance(Stat.CRIT_DMG, 1),
-                SubStatInstance(Stat.HP_PERCENT, 0),
-                SubStatInstance(Stat.DEF, 2),
-            ]
-        )
-    except (ValueError, TypeError) as e:
-        pytest.fail(f"Valid EquippedDriveDisc raised an unexpected error: {e}")
-
-@pytest.mark.parametrize("slot, main_stat, error_msg_part", [
-    (0, Stat.HP, "Invalid slot number: 0"),                 # Invalid slot low
-    (7, Stat.HP, "Invalid slot number: 7"),                 # Invalid slot high
-    (1, Stat.ATK, "Invalid main stat 'ATK' for slot 1"),    # Wrong main stat for slot 1
-    (4, Stat.HP, "Invalid main stat 'HP' for slot 4"),      # Wrong main stat for slot 4
-    (5, Stat.CRIT_DMG, "Invalid main stat 'CRIT DMG' for slot 5"),      # Wrong main stat for slot 5
+def test_equipped_disc_post_init_valid(baseline_kwargs):
+    """Test successful creation with valid parameters (any exception fails the test)."""
+    DriveDisc(
+        **{**baseline_kwargs, "sub_stats": [
+            SubStatInstance(Stat.CRIT_RATE, 2),
+            SubStatInstance(Stat.CRIT_DMG, 1),
+            SubStatInstance(Stat.HP_PERCENT, 0),
+            SubStatInstance(Stat.DEF, 2),
+        ]}
+    )
+
+@pytest.mark.parametrize("overrides, error_msg_part", [
+    # Slot / main stat combination
+    ({"slot": 0, "main_stat_type": Stat.HP}, "Invalid slot number: 0"),                      # Invalid slot low
+    ({"slot": 7, "main_stat_type": Stat.HP}, "Invalid slot number: 7"),                      # Invalid slot high
+    ({"slot": 1, "main_stat_type": Stat.ATK}, "Invalid main stat 'ATK' for slot 1"),         # Wrong main stat for slot 1
+    ({"slot": 4, "main_stat_type": Stat.HP}, "Invalid main stat 'HP' for slot 4"),           # Wrong main stat for slot 4
+    ({"slot": 5, "main_stat_type": Stat.CRIT_DMG}, "Invalid main stat 'CRIT DMG' for slot 5"), # Wrong main stat for slot 5
+    # Substats
+    ({"sub_stats": [SubStatInstance(Stat.HP, 0)] * 5}, "Cannot have more than 4 substats"),  # 5 substats
+    ({"sub_stats": [SubStatInstance(Stat.IMPACT, 0)]}, "Invalid substat type: 'Impact'"),    # Impact not in POSSIBLE_SUBSTATS
+    ({"sub_stats": [SubStatInstance(Stat.HP, 0), SubStatInstance(Stat.HP, 1)]}, "Duplicate substat type found: 'HP'"),
+    ({"sub_stats": [SubStatInstance(Stat.ATK_PERCENT, 0)]}, "cannot be the same as main stat"), # Substat matches main
+    ({"sub_stats": [SubStatInstance(Stat.HP, 3), SubStatInstance(Stat.ATK, 3)]},
+     "Total substat rolls (6) exceed maximum allowed (5)"),
+    # Per-substat roll limits are checked by SubStatInstance itself (see test_substatinstance_invalid_rolls)
 ])
-def test_equipped_disc_post_init_invalid_slot_main_stat(dummy_set_data, slot, main_stat, error_msg_part):
-    """Test validation failures for slot and main stat combination."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=slot,
-            main_stat_type=main_stat, sub_stats=[]
-        )
-    assert error_msg_part in str(excinfo.value)
-
-def test_equipped_disc_post_init_invalid_substat_count(dummy_set_data):
-    """Test validation failure for too many substats."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.HP, 0) ] * 5 # 5 substats
-        )
-    assert "Cannot have more than 4 substats" in str(excinfo.value)
-
-def test_equipped_disc_post_init_invalid_substat_type(dummy_set_data):
-    """Test validation failure for invalid substat type."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.IMPACT, 0) ] # Impact not in POSSIBLE_SUBSTATS
-        )
-    assert "Invalid substat type: 'Impact'" in str(excinfo.value)
-
-def test_equipped_disc_post_init_duplicate_substat(dummy_set_data):
-    """Test validation failure for duplicate substat types."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.HP, 0), SubStatInstance(Stat.HP, 1) ] # Duplicate HP
-        )
-    assert "Duplicate substat type found: 'HP'" in str(excinfo.value)
-
-def test_equipped_disc_post_init_substat_equals_mainstat(dummy_set_data):
-    """Test validation failure when a substat matches the main stat."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.ATK_PERCENT, 0) ] # Substat matches main
-        )
-    assert "cannot be the same as main stat" in str(excinfo.value)
-
-def test_equipped_disc_post_init_invalid_substat_rolls(dummy_set_data):
-    """Test validation failure for invalid number of substat rolls."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.HP, 6) ] # 6 rolls is invalid (max 5)
-        )
-    assert "Invalid number of rolls (6)" in str(excinfo.value)
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.HP, -1) ] # Negative rolls invalid
-        )
-    assert "Invalid number of rolls (-1)" in str(excinfo.value)
-
-def test_equipped_disc_post_init_invalid_substat_rolls(dummy_set_data):
-    """Test validation failure for invalid number of substat rolls."""
-    with pytest.raises(ValueError) as excinfo:
-        DriveDisc(
-            set_data=dummy_set_data, rarity=Rarity.S, level=15, slot=4,
-            main_stat_type=Stat.ATK_PERCENT,
-            sub_stats=[ SubStatInstance(Stat.HP, 3), SubStatInstance(Stat.ATK, 3) ] # Negative rolls invalid
-        )
-    assert "Total substat rolls (6) exceed maximum allowed (5)" in str(excinfo.value)
+def test_equipped_disc_post_init_invalid(baseline_kwargs, overrides, error_msg_part):
+    """Test __post_init__ validation failures, each case overriding a valid baseline disc."""
+    with pytest.raises(ValueError, match=re.escape(error_msg_part)):
+        DriveDisc(**{**baseline_kwargs, **overrides})
 
 def test_equipped_disc_post_init_level_clamping(dummy_set_data):
     """Test that level is clamped based on rarity during init."""
@@ -230,12 +190,81 @@ def test_equipped_disc_get_all_substat_values(dummy_set_data):
         Stat.ATK_PERCENT: 0.06,
         Stat.HP: 0.0,
     }
-    actual_values = disc.get_all_substat_values()
-    assert actual_values.keys() == expected_values.keys()
-    for stat, expected in expected_values.items():
-        assert actual_values[stat] == pytest.approx(expected)
+    assert disc.get_all_substat_values() == pytest.approx(expected_values) # Checks keys and values
 
     # Test with no substats
     disc_no_subs = DriveDisc(dummy_set_data, Rarity.S, 15, 1, Stat.HP, [])
     assert disc_no_subs.get_all_substat_values() == {}
 
+
+
+def test_equipped_disc_stat_values_cached(mock_gdl, dummy_set_data):
+    """Test main/sub stat values are cached until a stat-affecting field is reassigned."""
+    # The fake is shared across the module, so count lookups relative to this point
+    main_calls, sub_calls = mock_gdl.main_stat_calls, mock_gdl.substat_calls
+    disc = DriveDisc(dummy_set_data, Rarity.S, 10, 4, Stat.ATK_PERCENT, [SubStatInstance(Stat.CRIT_RATE, 1)])
+    assert disc.get_main_stat_value() == pytest.approx(0.20)
+    assert disc.get_all_substat_values()[Stat.CRIT_RATE] == pytest.approx(0.048)
+    disc.get_main_stat_value()
+    disc.get_all_substat_values()
+    assert mock_gdl.main_stat_calls == main_calls + 1
+    assert mock_gdl.substat_calls == sub_calls + 1
+
+    disc.level = 15 # Invalidates the cache
+    assert disc.get_main_stat_value() == pytest.approx(0.30)
+    assert mock_gdl.main_stat_calls == main_calls + 2
+
+def test_equipped_disc_sub_stats_immutable(mock_gdl, dummy_set_data):
+    """Test sub_stats is stored as a tuple and cached substat values are read-only."""
+    crit_rate = SubStatInstance(Stat.CRIT_RATE, 1)
+    disc = DriveDisc(dummy_set_data, Rarity.S, 15, 4, Stat.ATK_PERCENT, [crit_rate])
+    assert disc.sub_stats == (crit_rate,)
+    with pytest.raises(AttributeError):
+        disc.sub_stats.append(SubStatInstance(Stat.HP, 0)) # No in-place edits behind the cache's back
+    with pytest.raises(TypeError):
+        disc.get_all_substat_values()[Stat.HP] = 1.0
+
+    disc.sub_stats = [crit_rate, SubStatInstance(Stat.HP, 0)] # Reassigning converts and clears the cache
+    assert type(disc.sub_stats) is tuple
+    assert set(disc.get_all_substat_values()) == {Stat.CRIT_RATE, Stat.HP}
+
+def test_equipped_disc_from_raw(mock_gdl, dummy_set_data):
+    """Test from_raw builds a disc equal to the validated constructor's, with working caches."""
+    sub_stats = [SubStatInstance(Stat.CRIT_RATE, 1)]
+    raw = DriveDisc.from_raw(dummy_set_data, Rarity.S, 10, 4, Stat.ATK_PERCENT, sub_stats)
+    assert raw == DriveDisc(dummy_set_data, Rarity.S, 10, 4, Stat.ATK_PERCENT, sub_stats)
+    assert raw.get_main_stat_value() == pytest.approx(0.20)
+    raw.level = 15 # Invalidates the cache as usual
+    assert raw.get_main_stat_value() == pytest.approx(0.30)
+
+def test_equipped_disc_key(dummy_set_data):
+    """Test key() identifies a disc by its value-defining fields and follows field changes."""
+    def make_disc(set_data=dummy_set_data, rolls=1):
+        return DriveDisc(set_data, Rarity.S, 10, 4, Stat.ATK_PERCENT,
+                         [SubStatInstance(Stat.CRIT_RATE, rolls), SubStatInstance(Stat.HP, 0)])
+    disc = make_disc()
+    assert disc.key() == make_disc().key()
+    assert len({disc.key(), make_disc().key()}) == 1 # Usable for dedup sets
+    assert disc.key() != make_disc(rolls=2).key()
+    assert disc.key() != make_disc(set_data=DriveDiscSetData(name="Other Set")).key()
+    assert disc.key() == make_disc(set_data=DriveDiscSetData(name="Test Set")).key() # Sets are keyed by name
+    with pytest.raises(TypeError):
+        hash(disc) # Mutable, so the disc itself is not hashable
+
+    old_key = disc.key()
+    disc.level = 12
+    assert disc.key() != old_key
+    disc.sub_stats = disc.sub_stats[:1]
+    assert disc.key() != make_disc().key()
+
+@pytest.mark.parametrize("overrides", [
+    pytest.param({"level": 16}, id="level"),
+    pytest.param({"slot": 7}, id="slot"),
+    pytest.param({"sub_stats": [SubStatInstance(stat, 0) for stat in (Stat.HP, Stat.ATK, Stat.DEF, Stat.PEN, Stat.CRIT_RATE)]},
+                 id="five_substats"),
+])
+def test_equipped_disc_key_rejects_unpackable_fields(baseline_kwargs, overrides):
+    """Test key() raises instead of truncating fields of an invalid from_raw disc."""
+    disc = DriveDisc.from_raw(**{**baseline_kwargs, **overrides})
+    with pytest.raises(ValueError, match="Cannot build key"):
+        disc.key()
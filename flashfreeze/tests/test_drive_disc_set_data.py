@@ -1,132 +1,58 @@
 # tests/test_drive_disc_set_data.py
 
 import pytest
-import os
-import sys
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 
 from flashfreeze.core.drive_disc_set_data import DriveDiscSetData, DriveDisc2PieceBonus, DriveDisc4PieceBonus
 from flashfreeze.core.common import Stat
 
-# --- Test Data Fixtures ---
-
-@pytest.fixture(scope="module")
-def woodpecker_dict() -> Dict[str, Any]:
-    """Raw dictionary data for Woodpecker Electro Drive Disc set."""
-    return {
-        "2-piece": {
-            "stat": "CRIT Rate",
-            "value": 0.08
-        },
-        "4-piece": {
-            "description": "Landing a critical hit on an enemy with a Basic Attack, Dodge Counter, or EX Special Attack increases the equipper's ATK by {atk}% for {duration}s. The buff duration for different skills are calculated separately.",
-            "values": {
-                "atk": 9,
-                "duration": 6
-            }
-        }
-    }
-
-# Fixture for a valid, parsed DriveDiscSetData object
-@pytest.fixture(scope="module")
-def woodpecker_obj(woodpecker_dict) -> Optional[DriveDiscSetData]:
-    """Parsed DriveDiscSetData object for Woodpecker Electro."""
-    obj = DriveDiscSetData.from_dict("Woodpecker Electro", woodpecker_dict)
-    assert obj is not None, "Failed to parse woodpecker_dict fixture"
-    return obj
-
-# Fixture for the 2pc bonus object, useful for method testing
-@pytest.fixture(scope="module")
-def woodpecker_2pc_bonus_obj(woodpecker_obj) -> Optional[DriveDisc2PieceBonus]:
-    """Parsed DriveDisc2PieceBonus object for Woodpecker 2pc."""
-    assert woodpecker_obj is not None, "Dependency fixture woodpecker_obj failed"
-    return woodpecker_obj.bonus_2pc
-
-# Fixture for the 4pc bonus object, useful for method testing
-@pytest.fixture(scope="module")
-def woodpecker_4pc_bonus_obj(woodpecker_obj) -> Optional[DriveDisc4PieceBonus]:
-    """Parsed DriveDisc4PieceBonus object for Woodpecker 4pc."""
-    assert woodpecker_obj is not None, "Dependency fixture woodpecker_obj failed"
-    return woodpecker_obj.bonus_4pc
+# --- Test Data Tables ---
+
+# Built once at import; each row is labelled so failures name the scenario
+# (input dict, expected simple_stat, expected complex_stat, expected value)
+_2PC_CASES = (
+    pytest.param({"stat": "ATK", "value": 10}, Stat.ATK, None, 10, id="valid"),
+    pytest.param({"stat": "Energy Regen"}, Stat.ENERGY_REGEN, None, None, id="no_value"),      # Value is optional
+    pytest.param({"value": 15}, None, "", 15, id="no_stat"),
+    pytest.param({"stat": "NotAStat", "value": 10}, None, "NotAStat", 10, id="invalid_stat"),  # Kept as complex_stat
+    pytest.param({"stat": "HP", "value": "not a number"}, None, None, None, id="invalid_value"), # Default object
+)
+
+# (input dict, expected description, expected values)
+_4PC_CASES = (
+    pytest.param({"description": "Test desc {val1} and {val2}.", "values": {"val1": 10, "val2": "abc"}},
+                 "Test desc {val1} and {val2}.", {"val1": 10, "val2": "abc"}, id="valid"),
+    pytest.param({"values": {"atk": 5}}, None, {"atk": 5}, id="no_description"),
+    pytest.param({"description": "No values here."}, "No values here.", {}, id="no_values"),            # Empty dict
+    pytest.param({"description": "Desc.", "values": "not a dict"}, "Desc.", {}, id="invalid_values"),   # Empty dict
+)
 
 
 # --- Consolidated Tests ---
 
-def test_drivediscsetbonus_from_dict():
-    """Test DriveDiscSetBonus.from_dict parsing and defaults for 2pc and 4pc."""
-    # --- Test 2-Piece ---
-    # Valid 2pc
-    data_2pc_valid = {"stat": "ATK", "value": 10}
-    bonus_2pc_valid = DriveDisc2PieceBonus.from_dict(data_2pc_valid)
-    assert bonus_2pc_valid is not None
-    assert bonus_2pc_valid.simple_stat == Stat.ATK
-    assert bonus_2pc_valid.value == 10
-
-    # 2pc Missing value
-    data_2pc_no_val = {"stat": "Energy Regen"}
-    bonus_2pc_no_val = DriveDisc2PieceBonus.from_dict(data_2pc_no_val)
-    assert bonus_2pc_no_val is not None
-    assert bonus_2pc_no_val.simple_stat == Stat.ENERGY_REGEN
-    assert bonus_2pc_no_val.value is None # Value is optional
-
-    # 2pc Missing stat
-    data_2pc_no_stat = {"value": 15}
-    bonus_2pc_no_stat = DriveDisc2PieceBonus.from_dict(data_2pc_no_stat)
-    assert bonus_2pc_no_stat is not None
-    assert bonus_2pc_no_stat.simple_stat == None
-    assert bonus_2pc_no_stat.value == 15
-
-    # 2pc Invalid stat string
-    data_2pc_inv_stat = {"stat": "NotAStat", "value": 10}
-    bonus_2pc_inv_stat = DriveDisc2PieceBonus.from_dict(data_2pc_inv_stat)
-    assert bonus_2pc_inv_stat is not None
-    assert bonus_2pc_inv_stat.simple_stat == None
-    assert bonus_2pc_inv_stat.complex_stat == "NotAStat"
-    assert bonus_2pc_inv_stat.value == 10
-
-    # 2pc Invalid value type
-    data_2pc_inv_val = {"stat": "HP", "value": "not a number"}
-    bonus_2pc_inv_val = DriveDisc2PieceBonus.from_dict(data_2pc_inv_val)
-    assert bonus_2pc_inv_val is not None # Returns default object on parse error
-    assert bonus_2pc_inv_val.simple_stat == None
-    assert bonus_2pc_inv_val.value is None
-
-    # --- Test 4-Piece ---
-    # Valid 4pc
-    data_4pc_valid = {
-        "description": "Test desc {val1} and {val2}.",
-        "values": {"val1": 10, "val2": "abc"}
-    }
-    bonus_4pc_valid = DriveDisc4PieceBonus.from_dict(data_4pc_valid)
-    assert bonus_4pc_valid is not None
-    assert bonus_4pc_valid.description == "Test desc {val1} and {val2}."
-    assert bonus_4pc_valid.values == {"val1": 10, "val2": "abc"}
-
-    # 4pc Missing description
-    data_4pc_no_desc = {"values": {"atk": 5}}
-    bonus_4pc_no_desc = DriveDisc4PieceBonus.from_dict(data_4pc_no_desc)
-    assert bonus_4pc_no_desc is not None
-    assert bonus_4pc_no_desc.description is None
-    assert bonus_4pc_no_desc.values == {"atk": 5}
-
-    # 4pc Missing values
-    data_4pc_no_vals = {"description": "No values here."}
-    bonus_4pc_no_vals = DriveDisc4PieceBonus.from_dict(data_4pc_no_vals)
-    assert bonus_4pc_no_vals is not None
-    assert bonus_4pc_no_vals.description == "No values here."
-    assert bonus_4pc_no_vals.values == {} # Defaults to empty dict
-
-    # 4pc Invalid values type
-    data_4pc_inv_vals = {"description": "Desc.", "values": "not a dict"}
-    bonus_4pc_inv_vals = DriveDisc4PieceBonus.from_dict(data_4pc_inv_vals)
-    assert bonus_4pc_inv_vals is not None
-    assert bonus_4pc_inv_vals.description == "Desc."
-    assert bonus_4pc_inv_vals.values == {} # Defaults to empty dict
-
-    # --- Test General Edge Cases ---
-    # None input
-    assert DriveDisc2PieceBonus.from_dict(None) is None
-    assert DriveDisc4PieceBonus.from_dict(None) is None
+@pytest.mark.parametrize("data, simple, complex_, value", _2PC_CASES)
+def test_drivedisc2piecebonus_from_dict(data: Dict[str, Any], simple: Optional[Stat], complex_: Optional[str], value: Optional[float]):
+    """Test DriveDisc2PieceBonus.from_dict parsing and defaults."""
+    bonus = DriveDisc2PieceBonus.from_dict(data)
+    assert bonus is not None
+    assert bonus.simple_stat == simple
+    assert bonus.complex_stat == complex_
+    assert bonus.value == value
+
+
+@pytest.mark.parametrize("data, description, values", _4PC_CASES)
+def test_drivedisc4piecebonus_from_dict(data: Dict[str, Any], description: Optional[str], values: Dict[str, Any]):
+    """Test DriveDisc4PieceBonus.from_dict parsing and defaults."""
+    bonus = DriveDisc4PieceBonus.from_dict(data)
+    assert bonus is not None
+    assert bonus.description == description
+    assert bonus.values == values
+
+
+@pytest.mark.parametrize("bonus_cls", [DriveDisc2PieceBonus, DriveDisc4PieceBonus])
+def test_drivediscsetbonus_from_dict_none(bonus_cls):
+    """Test DriveDiscSetBonus.from_dict returns None for None input."""
+    assert bonus_cls.from_dict(None) is None
 
 
 def test_drivediscsetbonus_get_value_keys(woodpecker_4pc_bonus_obj: DriveDisc4PieceBonus):
@@ -169,12 +95,21 @@ def test_drivediscsetbonus_get_formatted_description(woodpecker_4pc_bonus_obj: D
     formatted_missing = bonus_missing_key.get_formatted_description()
     assert formatted_missing == "Value is 10 and {val2}" # {val2} is not replaced
 
+    # Test reassigning description or values clears the cached string
+    bonus_missing_key.values = {"val1": 10, "val2": 20}
+    assert bonus_missing_key.get_formatted_description() == "Value is 10 and 20"
+    bonus_missing_key.description = "Only {val2}"
+    assert bonus_missing_key.get_formatted_description() == "Only 20"
+
+    # Test repeated calls return the cached string
+    assert woodpecker_4pc_bonus_obj.get_formatted_description() is formatted
+
 
-def test_drivediscsetdata_from_dict(woodpecker_dict: Dict[str, Any]):
+def test_drivediscsetdata_from_dict(woodpecker_obj: Optional[DriveDiscSetData]):
     """Test DriveDiscSetData.from_dict parsing and defaults."""
-    # --- Test Valid Full Data ---
+    # --- Test Valid Full Data (parsed once by the session-scoped fixture) ---
     name = "Woodpecker Electro"
-    obj_valid = DriveDiscSetData.from_dict(name, woodpecker_dict)
+    obj_valid = woodpecker_obj
     assert obj_valid is not None
     assert isinstance(obj_valid, DriveDiscSetData)
     assert obj_valid.name == name
@@ -1,25 +1,24 @@
 # tests/test_game_data_loader.py
 
+import dataclasses
 import pytest
-import os
-import sys
-import json
-from decimal import Decimal, InvalidOperation # Use Decimal for precision
+from unittest.mock import patch
+from typing import List, Optional, Tuple, get_type_hints
 
 from flashfreeze.core.agent_data import AgentData
 from flashfreeze.core.common import Attribute, Rarity, Faction, Stat, SkillType
-from flashfreeze.core.skill_data import AgentSkillData
+from flashfreeze.core.skill_data import MultiplierData
+from flashfreeze.core.w_engine_data import WEngineData
 from flashfreeze import game_data_loader as gdl
 
-# --- Pytest Fixtures ---
+# --- Helpers ---
 
-@pytest.fixture(scope="module") # Load skills data once per test module
-def all_skills_data() -> AgentSkillData:
-    """Fixture to load skills data from JSON."""
-    data = AgentSkillData.from_dict(gdl.get_agent_skill_data(gdl.ELLEN_SKILLS_FILE))
-    if not data:
-        pytest.fail(f"Failed to load required test data from {gdl.ELLEN_SKILLS_FILE}")
-    return data
+# Published skill values have at most 4 decimal places, so scaling by 10^4 makes them exact ints
+_FIXED_POINT_SCALE = 10_000
+
+def _to_fixed(value) -> int:
+    """Converts a skill data value to a fixed-point int (units of 0.0001)."""
+    return round(float(value) * _FIXED_POINT_SCALE)
 
 # --- Test Functions ---
 
@@ -58,7 +57,7 @@ def test_load_known_agent():
     agent_names = gdl.get_all_agent_names()
 
     # --- ASSERT ---
-    assert isinstance(agent_names, list), "Should return a list of agent IDs."
+    assert isinstance(agent_names, tuple), "Should return a tuple of agent IDs."
     assert len(agent_names) > 0, "Agent ID list should not be empty (assuming data exists)."
     assert "Ellen" in agent_names, "A known agent ID should be in the list."
 
@@ -95,6 +94,28 @@ def test_load_agent_data():
     assert agent_obj.core_stat.value == 4.8 # Check core stat value
     assert agent_obj.info.full_name == "Ellen Joe" # Check info block
 
+def test_get_agent_and_w_engine_parsed_once():
+    """Test the object accessors parse each entry once and return the shared instance."""
+    agent_obj = gdl.get_agent("Ellen")
+    assert isinstance(agent_obj, AgentData)
+    assert agent_obj.base_stats.atk == 938
+    assert gdl.get_agent("Ellen") is agent_obj
+    assert gdl.get_agent("Definitely Not A Real Agent") is None
+    # The shared instance is frozen, down to its nested blocks
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        agent_obj.base_stats.atk = 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        agent_obj.info = None
+    # The annotation resolves once AgentData is in scope, as it is for type checkers
+    hints = get_type_hints(gdl.get_agent, localns={"AgentData": AgentData})
+    assert hints["return"] == Optional[AgentData]
+
+    engine_obj = gdl.get_w_engine("Steel Cushion")
+    assert isinstance(engine_obj, WEngineData)
+    assert engine_obj.name == "Steel Cushion"
+    assert gdl.get_w_engine("Steel Cushion") is engine_obj
+    assert gdl.get_w_engine("Definitely Not A Real Engine") is None
+
 @pytest.mark.parametrize("rarity, stat_type, expected_value", [
     # S Rank
     (Rarity.S, Stat.HP, 112.0),
@@ -160,86 +181,97 @@ def test_get_drive_main_stat_value(rarity, stat_type, level, expected_value):
         # Use approx for float comparisons
         assert value == pytest.approx(expected_value)
 
-def test_skill_scaling_integrity(all_skills_data: AgentSkillData): # Fixture is injected here
+def test_skill_scaling_integrity(flat_multipliers: List[Tuple[str, str, MultiplierData]]): # Fixture is injected here
     """
     Verify that Level 1 Value + (Step Value * 15) == Level 16 Value
-    for dmg_scaling and daze_scaling entries using AgentSkillData object.
+    for dmg_scaling and daze_scaling entries of every parsed MultiplierData.
     """
     # --- ARRANGE ---
-    # Data object is provided by the 'all_skills_data' fixture
+    # Multipliers are provided by the 'flat_multipliers' fixture
     mismatches = [] # Store details of skills that fail the check
+    report = mismatches.append # Bound once for the loop below
 
     # --- ACT ---
-    # Outer loop: Iterate through AbilityData objects in all_skills_data.skills
-    for skill_name, skill_obj in all_skills_data.skills.items():
-        # Inner loop: Iterate through MultiplierData objects in skill_obj.multipliers
-        for multiplier_name, multiplier_obj in skill_obj.multipliers.items():
-
-            # --- Check scaling ---
-            scaling_checks = []
-            if multiplier_obj.dmg_scaling:
-                scaling_checks.append(("DMG", multiplier_obj.dmg_scaling))
-            if multiplier_obj.daze_scaling:
-                scaling_checks.append(("Daze", multiplier_obj.daze_scaling))
-
-            for scaling_label, scaling_data in scaling_checks:
-                # Check required attributes exist (dataclass ensures they do, but check values)
-                try:
-                    # Access attributes directly
-                    val_l1 = Decimal(str(scaling_data.level_1))
-                    val_step = Decimal(str(scaling_data.step))
-                    val_l16_expected = Decimal(str(scaling_data.level_16))
-
-                    calculated_l16 = val_l1 + (val_step * Decimal(15))
-
-                    if not abs(calculated_l16 - val_l16_expected) < Decimal('0.0001'):
-                        mismatches.append(
-                            f"Mismatch in '{skill_name}' -> '{multiplier_name}' ({scaling_label}): "
-                            f"Expected level 16 value {val_l16_expected}, but calculated {calculated_l16} "
-                            f"(Level 1: {val_l1}, step: {val_step})"
-                        )
-                except (InvalidOperation, ValueError, TypeError) as e:
-                    mismatches.append(
-                        f"Error in '{skill_name}' -> '{multiplier_name}' ({scaling_label}): Processing values - {e}. "
-                        f"L1='{getattr(scaling_data, 'level_1', 'N/A')}', "
-                        f"Step='{getattr(scaling_data, 'step', 'N/A')}', "
-                        f"L16='{getattr(scaling_data, 'level_16', 'N/A')}'"
+    # Single pass over every MultiplierData, flattened once by the 'flat_multipliers' fixture
+    for skill_name, multiplier_name, multiplier_obj in flat_multipliers:
+
+        # --- Check scaling ---
+        # Fixed pair of candidates, so no list is built per multiplier
+        for scaling_label, scaling_data in (("DMG", multiplier_obj.dmg_scaling), ("Daze", multiplier_obj.daze_scaling)):
+            if not scaling_data:
+                continue
+            # Check required attributes exist (dataclass ensures they do, but check values)
+            try:
+                # Access attributes directly; fixed-point ints compare exactly
+                val_l1 = _to_fixed(scaling_data.level_1)
+                val_step = _to_fixed(scaling_data.step)
+                val_l16_expected = _to_fixed(scaling_data.level_16)
+
+                calculated_l16 = val_l1 + val_step * 15
+
+                if calculated_l16 != val_l16_expected: # Same as a difference below 0.0001 at 4 decimal places
+                    report(
+                        f"Mismatch in '{skill_name}' -> '{multiplier_name}' ({scaling_label}): "
+                        f"Expected level 16 value {scaling_data.level_16}, but calculated {calculated_l16 / _FIXED_POINT_SCALE} "
+                        f"(Level 1: {scaling_data.level_1}, step: {scaling_data.step})"
                     )
+            except (ValueError, TypeError, OverflowError) as e:
+                report(
+                    f"Error in '{skill_name}' -> '{multiplier_name}' ({scaling_label}): Processing values - {e}. "
+                    f"L1='{getattr(scaling_data, 'level_1', 'N/A')}', "
+                    f"Step='{getattr(scaling_data, 'step', 'N/A')}', "
+                    f"L16='{getattr(scaling_data, 'level_16', 'N/A')}'"
+                )
 
-            # --- Check hit count and damage spread ---
-            # Access attributes directly from multiplier_obj
-            hit_count = multiplier_obj.hit_count
-            damage_spread = multiplier_obj.damage_spread
+        # --- Check hit count and damage spread ---
+        # Access attributes directly from multiplier_obj
+        hit_count = multiplier_obj.hit_count
+        damage_spread = multiplier_obj.damage_spread
 
-            if not isinstance(hit_count, int) or hit_count <= 0:
-                 mismatches.append(
-                     f"Skill '{skill_name}' -> '{multiplier_name}': Invalid hit count '{hit_count}'. Must be a positive integer."
+        if not isinstance(hit_count, int) or hit_count <= 0:
+             report(
+                 f"Skill '{skill_name}' -> '{multiplier_name}': Invalid hit count '{hit_count}'. Must be a positive integer."
+             )
+        # Only check spread if hit_count is valid and spread exists
+        elif damage_spread: # Check if list is not empty/None
+            if not isinstance(damage_spread, list):
+                 report(
+                     f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' is not a list."
                  )
-            # Only check spread if hit_count is valid and spread exists
-            elif damage_spread: # Check if list is not empty/None
-                if not isinstance(damage_spread, list):
-                     mismatches.append(
-                         f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' is not a list."
-                     )
-                elif len(damage_spread) != hit_count:
-                     mismatches.append(
-                         f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' length ({len(damage_spread)}) does not match hit count ({hit_count})."
-                     )
-                else:
-                    try:
-                        # Ensure all values in spread are convertible to Decimal
-                        spread_sum = sum(Decimal(str(value)) for value in damage_spread)
-                        # Use a slightly larger tolerance for sums
-                        if not abs(spread_sum - Decimal('1.0')) <= Decimal('0.0001'):
-                             mismatches.append(
-                                 f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' values sum to {spread_sum}, "
-                                 f"which is not approximately 1.0 (error tolerance: 0.0001)."
-                             )
-                    except (InvalidOperation, ValueError, TypeError) as e:
-                         mismatches.append(
-                             f"Skill '{skill_name}' -> '{multiplier_name}': Error processing 'damage_spread' values - {e}."
+            elif len(damage_spread) != hit_count:
+                 report(
+                     f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' length ({len(damage_spread)}) does not match hit count ({hit_count})."
+                 )
+            else:
+                try:
+                    # Ensure all values in spread are numeric, summed in fixed point
+                    spread_sum = sum(map(_to_fixed, damage_spread))
+                    # Use a slightly larger tolerance for sums (one unit = 0.0001)
+                    if abs(spread_sum - _FIXED_POINT_SCALE) > 1:
+                         report(
+                             f"Skill '{skill_name}' -> '{multiplier_name}': 'damage_spread' values sum to {spread_sum / _FIXED_POINT_SCALE}, "
+                             f"which is not approximately 1.0 (error tolerance: 0.0001)."
                          )
+                except (ValueError, TypeError, OverflowError) as e:
+                     report(
+                         f"Skill '{skill_name}' -> '{multiplier_name}': Error processing 'damage_spread' values - {e}."
+                     )
 
     # --- ASSERT ---
     # Final assertion after checking all skills and multipliers
-    assert not mismatches, "Found skill data integrity issues:\n" + "\n".join(mismatches)
\ No newline at end of file
+    assert not mismatches, "Found skill data integrity issues:\n" + "\n".join(mismatches)
+
+
+def test_get_w_engine_stats_scaling_table():
+    """Test base ATK lookups read the per-level table parsed from 'base_atk_scaling'."""
+    engine_dict = {"base_atk_scaling": {"1": "48", "60": 684, "10": "not a number"}}
+    gdl._get_w_engine_base_atk_table.cache_clear()
+    try:
+        with patch.object(gdl, "get_w_engine_data", return_value=engine_dict) as mock_get:
+            assert gdl.get_w_engine_stats("Test Engine", 1) == 48.0
+            assert gdl.get_w_engine_stats("Test Engine", 60) == 684.0
+            assert gdl.get_w_engine_stats("Test Engine", 10) is None # Invalid value
+            assert gdl.get_w_engine_stats("Test Engine", 61) is None # Out of range
+            assert mock_get.call_count == 1 # Parsed once
+    finally:
+        gdl._get_w_engine_base_atk_table.cache_clear()
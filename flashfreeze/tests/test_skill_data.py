@@ -0,0 +1,24 @@
+# tests/test_skill_data.py
+
+import pytest
+
+from flashfreeze.core.skill_data import ScalingData
+
+
+@pytest.mark.parametrize("level, expected_value", [
+    (-1, 50.0),     # Below range -> level 1 value
+    (0, 50.0),
+    (1, 50.0),
+    (2, 55.0),
+    (10, 95.0),
+    (15, 120.0),
+    (16, 125.5),    # Level 16 uses the stored value, not the interpolation
+    (20, 125.5),    # Above range -> level 16 value
+    (2.5, 57.5),    # Non-int level -> interpolated, not looked up
+    (0.5, 50.0),
+    (16.5, 125.5),
+])
+def test_scaling_data_get_value_at_level(level, expected_value):
+    """Test ScalingData.get_value_at_level interpolation and clamping."""
+    scaling = ScalingData.from_dict({"step": 5.0, "1": 50.0, "16": 125.5})
+    assert scaling.get_value_at_level(level) == pytest.approx(expected_value)
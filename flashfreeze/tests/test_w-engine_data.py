@@ -1,138 +1,140 @@
 # tests/test_w-engine_data.py
 
+import logging
 import pytest
-import os
-import sys
-from typing import Dict, Any, Optional, List
 
 from flashfreeze.core.w_engine_data import WEngineData, WEngineAdvancedStat, WEnginePassive, WEngine
 from flashfreeze.core.common import Rarity, Stat, Specialty
 
-# --- Test Data Fixtures ---
-
-@pytest.fixture(scope="module")
-def steel_cushion_dict() -> Dict[str, Any]:
-    """Raw dictionary data for Steel Cushion W-Engine."""
-    return {
-        "specialty": "attack", # Use lowercase as in original JSON example
-        "rarity": "S",
-        "base_atk": "684",
-        "advanced_stat": {
-            "stat": "CRIT Rate",
-            "value": 0.24
-        },
-        "passive": {
-            "name": "Metal Cat Claws",
-            "description": "Increases Physical DMG by {physical_dmg}%. The equipper's DMG increases by {back_dmg}% when hitting the enemy from behind.",
-            "values": {
-                "phase_1": {"physical_dmg": 20, "back_dmg": 25},
-                "phase_2": {"physical_dmg": 25, "back_dmg": 31.5},
-                "phase_3": {"physical_dmg": 30, "back_dmg": 38},
-                "phase_4": {"physical_dmg": 35, "back_dmg": 44},
-                "phase_5": {"physical_dmg": 40, "back_dmg": 50}
-            }
-        }
-    }
-
-# Fixture for a valid, parsed WEngineData object
-@pytest.fixture(scope="module")
-def steel_cushion_obj(steel_cushion_dict) -> Optional[WEngineData]:
-    """Parsed WEngineData object for Steel Cushion."""
-    obj = WEngineData.from_dict("Steel Cushion", steel_cushion_dict)
-    assert obj is not None, "Failed to parse steel_cushion_dict fixture"
-    return obj
+# --- Test Case Tables ---
 
-# Fixture for just the passive object, useful for method testing
-@pytest.fixture(scope="module")
-def steel_cushion_passive_obj(steel_cushion_obj) -> Optional[WEnginePassive]:
-    """Parsed WEnginePassive object for Steel Cushion."""
-    assert steel_cushion_obj is not None, "Dependency fixture steel_cushion_obj failed"
-    return steel_cushion_obj.passive
+# (phase, key, expected value) for phases 1-5, shared by the WEnginePassive and WEngine tests
+_PASSIVE_VALUE_CASES = (
+    (1, "physical_dmg", 20),
+    (5, "physical_dmg", 40),
+    (1, "back_dmg", 25),
+    (5, "back_dmg", 50),
+    (3, "physical_dmg", 30),
+    (1, "non_existent_key", None), # Key not present
+)
+
+# Out-of-range phases; WEngine clamps these, so only WEnginePassive sees them
+_INVALID_PHASE_CASES = (
+    (0, "physical_dmg", None), # Invalid phase low
+    (6, "physical_dmg", None), # Invalid phase high
+    (2.0, "physical_dmg", None), # Non-int phase, even if integral
+    (1.5, "physical_dmg", None), # Non-int phase
+)
+
+# (phase, expected formatted description)
+_FORMATTED_DESCRIPTION_CASES = (
+    (1, "Increases Physical DMG by 20%. The equipper's DMG increases by 25% when hitting the enemy from behind."),
+    (3, "Increases Physical DMG by 30%. The equipper's DMG increases by 38% when hitting the enemy from behind."),
+    (5, "Increases Physical DMG by 40%. The equipper's DMG increases by 50% when hitting the enemy from behind."),
+)
+
+# (level, modification, phase, expected level, expected modification, expected phase)
+_CLAMPING_CASES = (
+    (70, 5, 3, 60, 5, 3),   # Level too high for mod 5 -> clamped to 60
+    (-5, 0, 3, 0, 0, 3),    # Level too low -> clamped to 0
+    (50, 6, 3, 50, 5, 3),   # Modification too high -> clamped to 5
+    (10, -1, 3, 10, 0, 3),  # Modification too low -> clamped to 0
+    (35, 3, 0, 35, 3, 1),   # Phase too low -> clamped to 1
+    (35, 3, 6, 35, 3, 5),   # Phase too high -> clamped to 5
+)
+
+# (level, modification, expected final level)
+_LEVEL_MODIFICATION_CASES = (
+    (25, 1, 20), # Level 25 too high for mod 1 (max 20) -> clamped to 20
+    ( 5, 1, 10), # Level 5 too low for mod 1 (min 10) -> clamped to 10
+    (42, 4, 42), # Level 42 is valid for mod 4 (40-50)
+    (59, 5, 59), # Level 59 is valid for mod 5 (50-60)
+    ( 0, 0, 0),  # Level 0 is valid for mod 0 (0-10)
+    (10, 0, 10), # Level 10 valid for mod 0 (0-10)
+    (10, 1, 10), # Level 10 valid for mod 1 (10-20)
+    (20, 1, 20), # Level 20 valid for mod 1 (10-20)
+    (20, 2, 20), # Level 20 valid for mod 2 (20-30)
+    (30, 2, 30), # Level 30 valid for mod 2 (20-30)
+    (30, 3, 30), # Level 30 valid for mod 3 (30-40)
+    (40, 3, 40), # Level 40 valid for mod 3 (30-40)
+    (40, 4, 40), # Level 40 valid for mod 4 (40-50)
+    (50, 4, 50), # Level 50 valid for mod 4 (40-50)
+    (50, 5, 50), # Level 50 is valid for mod 5 (50-60)
+    (60, 5, 60), # Level 60 is valid for mod 5 (50-60)
+)
+
+
+# (input dict, expected stat, expected value)
+_ADVANCED_STAT_CASES = (
+    pytest.param({"stat": "CRIT DMG", "value": 0.48}, Stat.CRIT_DMG, 0.48, id="valid"),
+    pytest.param({"stat": "ATK"}, Stat.ATK, 0.0, id="no_value"),                                # Value defaults to 0.0
+    pytest.param({"value": 0.3}, Stat.UNKNOWN, 0.3, id="no_stat"),                              # Stat defaults to UNKNOWN
+    pytest.param({"stat": "Invalid Stat Name", "value": 0.5}, Stat.UNKNOWN, 0.5, id="invalid_stat"),
+    pytest.param({}, Stat.UNKNOWN, 0.0, id="empty"),
+)
+
+# (input dict, expected name) for passive blocks missing description/values
+_PASSIVE_DEFAULT_CASES = (
+    pytest.param({"name": "Test Passive"}, "Test Passive", id="missing_keys"),
+    pytest.param({}, None, id="empty"),
+)
+
+# (name, input dict, expected base ATK) for W-Engines missing optional keys
+_WENGINE_DATA_DEFAULT_CASES = (
+    pytest.param("Test Engine Missing Keys", {"base_atk": "100"}, 100, id="only_base_atk"),
+    pytest.param("Some Name", {}, 0, id="empty"),
+)
 
 
 # --- Consolidated Tests ---
 
-def test_wengineadvancedstat_from_dict():
+def test_from_dict_returns_correct_type(steel_cushion_dict):
+    """Test WEngineData.from_dict and its nested parsers return their own classes."""
+    obj = WEngineData.from_dict("Steel Cushion", steel_cushion_dict)
+    assert type(obj) is WEngineData
+    assert type(obj.advanced_stat) is WEngineAdvancedStat
+    assert type(obj.passive) is WEnginePassive
+
+@pytest.mark.parametrize("data, expected_stat, expected_value", _ADVANCED_STAT_CASES)
+def test_wengineadvancedstat_from_dict(data, expected_stat, expected_value):
     """Test WEngineAdvancedStat.from_dict parsing and defaults."""
-    # Valid case
-    data_valid = {"stat": "CRIT DMG", "value": 0.48}
-    advanced_stat_valid = WEngineAdvancedStat.from_dict(data_valid)
-    assert advanced_stat_valid is not None
-    assert isinstance(advanced_stat_valid, WEngineAdvancedStat)
-    assert advanced_stat_valid.stat == Stat.CRIT_DMG
-    assert advanced_stat_valid.value == 0.48
-
-    # Missing value
-    data_no_val = {"stat": "ATK"}
-    advanced_stat_no_val = WEngineAdvancedStat.from_dict(data_no_val)
-    assert advanced_stat_no_val is not None
-    assert advanced_stat_no_val.stat == Stat.ATK
-    assert advanced_stat_no_val.value == 0.0 # Default
-
-    # Missing stat
-    data_no_stat = {"value": 0.3}
-    advanced_stat_no_stat = WEngineAdvancedStat.from_dict(data_no_stat)
-    assert advanced_stat_no_stat is not None
-    assert advanced_stat_no_stat.stat == Stat.UNKNOWN # Default
-    assert advanced_stat_no_stat.value == 0.3
-
-    # Invalid stat string
-    data_inv_stat = {"stat": "Invalid Stat Name", "value": 0.5}
-    advanced_stat_inv_stat = WEngineAdvancedStat.from_dict(data_inv_stat)
-    assert advanced_stat_inv_stat is not None
-    assert advanced_stat_inv_stat.stat == Stat.UNKNOWN # Parsed as UNKNOWN
-    assert advanced_stat_inv_stat.value == 0.5
-
-    # Invalid value type
-    data_inv_val = {"stat": "HP", "value": "not a number"}
-    advanced_stat_inv_val = WEngineAdvancedStat.from_dict(data_inv_val)
-    assert advanced_stat_inv_val is None # Should fail parsing
-
-    # None and Empty input
-    assert WEngineAdvancedStat.from_dict(None) is None
-    advanced_stat_empty = WEngineAdvancedStat.from_dict({})
-    assert advanced_stat_empty is not None # Returns default object
-    assert advanced_stat_empty.stat == Stat.UNKNOWN
-    assert advanced_stat_empty.value == 0.0
+    advanced_stat = WEngineAdvancedStat.from_dict(data)
+    assert advanced_stat is not None
+    assert advanced_stat.stat == expected_stat
+    assert advanced_stat.value == expected_value
+
+@pytest.mark.parametrize("data", [
+    pytest.param({"stat": "HP", "value": "not a number"}, id="invalid_value"), # Should fail parsing
+    pytest.param(None, id="none"),
+])
+def test_wengineadvancedstat_from_dict_returns_none(data):
+    """Test WEngineAdvancedStat.from_dict returns None for unparseable input."""
+    assert WEngineAdvancedStat.from_dict(data) is None
 
 def test_wenginepassive_from_dict(steel_cushion_dict):
-    """Test WEnginePassive.from_dict parsing and defaults."""
-    # Valid case
+    """Test WEnginePassive.from_dict parsing of a full passive block."""
     passive_data = steel_cushion_dict.get("passive")
     passive_valid = WEnginePassive.from_dict(passive_data)
     assert passive_valid is not None
-    assert isinstance(passive_valid, WEnginePassive)
     assert passive_valid.name == "Metal Cat Claws"
     assert "Increases Physical DMG" in passive_valid.description
     assert isinstance(passive_valid.values, dict)
     assert "phase_1" in passive_valid.values
     assert passive_valid.values["phase_1"]["physical_dmg"] == 20
 
-    # Missing keys case
-    passive_missing = WEnginePassive.from_dict({"name": "Test Passive"})
-    assert passive_missing is not None
-    assert passive_missing.name == "Test Passive"
-    assert passive_missing.description is None
-    assert passive_missing.values == {}
-
-    # None and Empty input
+    # None input
     assert WEnginePassive.from_dict(None) is None
-    passive_empty = WEnginePassive.from_dict({})
-    assert passive_empty is not None # Returns default object
-    assert passive_empty.name is None
-    assert passive_empty.description is None
-    assert passive_empty.values == {}
 
-@pytest.mark.parametrize("phase, key, expected_value", [
-    (1, "physical_dmg", 20),
-    (5, "physical_dmg", 40),
-    (1, "back_dmg", 25),
-    (5, "back_dmg", 50),
-    (3, "physical_dmg", 30),
-    (1, "non_existent_key", None), # Key not present
-    (0, "physical_dmg", None), # Invalid phase low
-    (6, "physical_dmg", None), # Invalid phase high
-])
+@pytest.mark.parametrize("data, expected_name", _PASSIVE_DEFAULT_CASES)
+def test_wenginepassive_from_dict_defaults(data, expected_name):
+    """Test WEnginePassive.from_dict fills missing keys with defaults."""
+    passive = WEnginePassive.from_dict(data)
+    assert passive is not None # Returns default object
+    assert passive.name == expected_name
+    assert passive.description is None
+    assert passive.values == {}
+
+@pytest.mark.parametrize("phase, key, expected_value", _PASSIVE_VALUE_CASES + _INVALID_PHASE_CASES)
 def test_wenginepassive_get_passive_value(steel_cushion_passive_obj, phase, key, expected_value):
     """Test WEnginePassive.get_passive_value for various phases and keys."""
     assert steel_cushion_passive_obj is not None
@@ -144,32 +146,27 @@ def test_wenginepassive_get_value_keys(steel_cushion_passive_obj):
     # Test with valid data
     assert steel_cushion_passive_obj is not None
     keys = steel_cushion_passive_obj.get_value_keys()
-    assert isinstance(keys, list)
+    assert isinstance(keys, tuple) # Immutable, so the cached keys cannot be altered by callers
     assert set(keys) == {"physical_dmg", "back_dmg"} # Use set for order-independent check
+    assert steel_cushion_passive_obj.get_value_keys() is keys # Cached after the first call
 
     # Test with empty values
     passive_no_values = WEnginePassive(name="Test", description="Desc", values={})
     keys_no_values = passive_no_values.get_value_keys()
-    assert keys_no_values == []
+    assert keys_no_values == ()
 
     # Test with invalid phase_1 data (though fixture assumes valid)
     passive_bad_phase1 = WEnginePassive(name="Test", description="Desc", values={"phase_1": "not a dict"})
     keys_bad_phase1 = passive_bad_phase1.get_value_keys()
-    assert keys_bad_phase1 == []
+    assert keys_bad_phase1 == ()
 
 
-@pytest.mark.parametrize("phase, expected_desc_part_1, expected_desc_part_2", [
-    (1, "by 20%", "by 25%"),
-    (3, "by 30%", "by 38%"),
-    (5, "by 40%", "by 50%"),
-])
-def test_wenginepassive_get_formatted_description(steel_cushion_passive_obj, phase, expected_desc_part_1, expected_desc_part_2):
+@pytest.mark.parametrize("phase, expected_description", _FORMATTED_DESCRIPTION_CASES)
+def test_wenginepassive_get_formatted_description(steel_cushion_passive_obj, formatted_descriptions, phase, expected_description):
     """Test WEnginePassive.get_formatted_description for different phases."""
-    assert steel_cushion_passive_obj is not None
-    formatted = steel_cushion_passive_obj.get_formatted_description(phase)
-    assert isinstance(formatted, str)
-    assert expected_desc_part_1 in formatted
-    assert expected_desc_part_2 in formatted
+    formatted = formatted_descriptions[phase]
+    assert formatted == expected_description
+    assert steel_cushion_passive_obj.get_formatted_description(phase) is formatted # Cached per phase
 
 def test_wenginepassive_get_formatted_description_edge_cases(steel_cushion_passive_obj):
     """Test WEnginePassive.get_formatted_description edge cases."""
@@ -179,6 +176,8 @@ def test_wenginepassive_get_formatted_description_edge_cases(steel_cushion_passi
     # Invalid phase
     assert steel_cushion_passive_obj.get_formatted_description(0) == original_desc
     assert steel_cushion_passive_obj.get_formatted_description(6) == original_desc
+    assert steel_cushion_passive_obj.get_formatted_description(2.0) == original_desc
+    assert steel_cushion_passive_obj.get_formatted_description(1.5) == original_desc
 
     # No description
     passive_no_desc = WEnginePassive(name="Test", values={"phase_1": {"val": 10}})
@@ -201,51 +200,37 @@ def test_wenginedata_from_dict(steel_cushion_dict):
     name = "Steel Cushion"
     obj_valid = WEngineData.from_dict(name, steel_cushion_dict)
     assert obj_valid is not None
-    assert isinstance(obj_valid, WEngineData)
     assert obj_valid.name == name
     assert obj_valid.specialty == Specialty.ATTACK # Check enum parsing
     assert obj_valid.rarity == Rarity.S
     assert obj_valid.base_atk == 684 # Check int conversion
     assert obj_valid.advanced_stat is not None
-    assert isinstance(obj_valid.advanced_stat, WEngineAdvancedStat)
     assert obj_valid.advanced_stat.stat == Stat.CRIT_RATE
     assert obj_valid.advanced_stat.value == 0.24
     assert obj_valid.passive is not None
-    assert isinstance(obj_valid.passive, WEnginePassive)
     assert obj_valid.passive.name == "Metal Cat Claws"
 
     # --- Test Invalid Base ATK ---
     name_inv_atk = "Test Engine Invalid ATK"
-    data_inv_atk = steel_cushion_dict.copy()
-    data_inv_atk["base_atk"] = "not a number"
+    data_inv_atk = {**steel_cushion_dict, "base_atk": "not a number"} # Never mutates the shared fixture
     obj_inv_atk = WEngineData.from_dict(name_inv_atk, data_inv_atk)
     assert obj_inv_atk is not None
     assert obj_inv_atk.base_atk == 0 # Defaults to 0
 
-    # --- Test Missing Optional Keys ---
-    name_missing = "Test Engine Missing Keys"
-    data_missing = {"base_atk": "100"} # Only base_atk provided
-    obj_missing = WEngineData.from_dict(name_missing, data_missing)
-    assert obj_missing is not None
-    assert obj_missing.name == name_missing
-    assert obj_missing.base_atk == 100
-    assert obj_missing.specialty == Specialty.UNKNOWN # Default enum
-    assert obj_missing.rarity == Rarity.UNKNOWN # Default enum
-    assert obj_missing.advanced_stat is None
-    assert obj_missing.passive is None
-
     # --- Test None Input ---
     assert WEngineData.from_dict("Some Name", None) is None
 
-    # --- Test Empty Input ---
-    obj_empty = WEngineData.from_dict("Some Name", {})
-    assert obj_empty is not None # Returns default object
-    assert obj_empty.name == "Some Name"
-    assert obj_empty.specialty == Specialty.UNKNOWN
-    assert obj_empty.rarity == Rarity.UNKNOWN
-    assert obj_empty.base_atk == 0
-    assert obj_empty.advanced_stat is None
-    assert obj_empty.passive is None
+@pytest.mark.parametrize("name, data, expected_base_atk", _WENGINE_DATA_DEFAULT_CASES)
+def test_wenginedata_from_dict_defaults(name, data, expected_base_atk):
+    """Test WEngineData.from_dict fills missing keys with defaults."""
+    obj = WEngineData.from_dict(name, data)
+    assert obj is not None # Returns default object
+    assert obj.name == name
+    assert obj.base_atk == expected_base_atk
+    assert obj.specialty == Specialty.UNKNOWN # Default enum
+    assert obj.rarity == Rarity.UNKNOWN # Default enum
+    assert obj.advanced_stat is None
+    assert obj.passive is None
 
 def test_equippedwengine_post_init_valid(steel_cushion_obj):
     """Test successful creation with valid parameters."""
@@ -259,14 +244,7 @@ def test_equippedwengine_post_init_valid(steel_cushion_obj):
     except Exception as e:
         pytest.fail(f"Valid EquippedWEngine raised an unexpected error: {e}")
 
-@pytest.mark.parametrize("level, modification, phase, expected_level, expected_mod, expected_phase", [
-    (70, 5, 3, 60, 5, 3),   # Level too high for mod 5 -> clamped to 60
-    (-5, 0, 3, 0, 0, 3),    # Level too low -> clamped to 0
-    (50, 6, 3, 50, 5, 3),   # Modification too high -> clamped to 5
-    (10, -1, 3, 10, 0, 3),  # Modification too low -> clamped to 0
-    (35, 3, 0, 35, 3, 1),   # Phase too low -> clamped to 1
-    (35, 3, 6, 35, 3, 5),   # Phase too high -> clamped to 5
-])
+@pytest.mark.parametrize("level, modification, phase, expected_level, expected_mod, expected_phase", _CLAMPING_CASES)
 def test_equippedwengine_post_init_clamping(steel_cushion_obj, level, modification, phase, expected_level, expected_mod, expected_phase):
     """Test clamping of level, modification, and phase."""
     eq_wengine = WEngine(steel_cushion_obj, level, modification, phase)
@@ -274,30 +252,27 @@ def test_equippedwengine_post_init_clamping(steel_cushion_obj, level, modificati
     assert eq_wengine.modification == expected_mod
     assert eq_wengine.phase == expected_phase
 
-@pytest.mark.parametrize("level, modification, expected_final_level", [
-    (25, 1, 20), # Level 25 too high for mod 1 (max 20) -> clamped to 20
-    ( 5, 1, 10), # Level 5 too low for mod 1 (min 10) -> clamped to 10
-    (42, 4, 42), # Level 42 is valid for mod 4 (40-50)
-    (59, 5, 59), # Level 59 is valid for mod 5 (50-60)
-    ( 0, 0, 0),  # Level 0 is valid for mod 0 (0-10)
-    (10, 0, 10), # Level 10 valid for mod 0 (0-10)
-    (10, 1, 10), # Level 10 valid for mod 1 (10-20)
-    (20, 1, 20), # Level 20 valid for mod 1 (10-20)
-    (20, 2, 20), # Level 20 valid for mod 2 (20-30)
-    (30, 2, 30), # Level 30 valid for mod 2 (20-30)
-    (30, 3, 30), # Level 30 valid for mod 3 (30-40)
-    (40, 3, 40), # Level 40 valid for mod 3 (30-40)
-    (40, 4, 40), # Level 40 valid for mod 4 (40-50)
-    (50, 4, 50), # Level 50 valid for mod 4 (40-50)
-    (50, 5, 50), # Level 50 is valid for mod 5 (50-60)
-    (60, 5, 60), # Level 60 is valid for mod 5 (50-60)
-])
+@pytest.mark.parametrize("level, modification, expected_final_level", _LEVEL_MODIFICATION_CASES)
 def test_equippedwengine_post_init_level_modification_range(steel_cushion_obj, level, modification, expected_final_level):
     """Test level adjustment based on modification range."""
-    # Note: The print statement in __post_init__ will show during test runs with -s
+    # Note: Adjusted levels are reported through the module logger (shown in pytest's captured log)
     eq_wengine = WEngine(steel_cushion_obj, level, modification, 1)
     assert eq_wengine.level == expected_final_level
 
+@pytest.mark.parametrize("level, modification, expect_warning", [
+    pytest.param(70, 5, False, id="above_60_clamped_silently"),
+    pytest.param(-5, 0, False, id="below_0_clamped_silently"),
+    pytest.param(25, 1, True, id="above_band_warns"),
+    pytest.param(5, 1, True, id="below_band_warns"),
+    pytest.param(42, 4, False, id="in_band"),
+])
+def test_equippedwengine_post_init_level_warning(steel_cushion_obj, caplog, level, modification, expect_warning):
+    """Test only level adjustments into the modification band are logged."""
+    with caplog.at_level(logging.WARNING, logger="flashfreeze.core.w_engine_data"):
+        WEngine(steel_cushion_obj, level, modification, 1)
+    warned = any("out of range for modification" in record.getMessage() for record in caplog.records)
+    assert warned == expect_warning
+
 def test_equippedwengine_get_current_base_atk(steel_cushion_obj):
     """Test get_current_base_atk (currently placeholder behavior)."""
     # Test with different levels, should currently return the max level base ATK
@@ -321,27 +296,15 @@ def test_equippedwengine_get_advanced_stat(steel_cushion_obj):
     assert adv_stat[0] == Stat.CRIT_RATE
     assert adv_stat[1] == pytest.approx(0.24)
 
-@pytest.mark.parametrize("phase, key, expected_value", [
-    (1, "physical_dmg", 20),
-    (5, "back_dmg", 50),
-    (3, "physical_dmg", 30),
-    (1, "non_existent_key", None),
-])
+@pytest.mark.parametrize("phase, key, expected_value", _PASSIVE_VALUE_CASES)
 def test_equippedwengine_get_passive_value(steel_cushion_obj, phase, key, expected_value):
     """Test get_passive_value fetches correct value based on phase."""
     eq_wengine = WEngine(steel_cushion_obj, level=60, modification=5, phase=phase)
     value = eq_wengine.get_passive_value(key)
     assert value == expected_value
 
-@pytest.mark.parametrize("phase, expected_desc_part_1, expected_desc_part_2", [
-    (1, "by 20%", "by 25%"),
-    (3, "by 30%", "by 38%"),
-    (5, "by 40%", "by 50%"),
-])
-def test_equippedwengine_get_formatted_passive_description(steel_cushion_obj, phase, expected_desc_part_1, expected_desc_part_2):
+@pytest.mark.parametrize("phase, expected_description", _FORMATTED_DESCRIPTION_CASES)
+def test_equippedwengine_get_formatted_passive_description(steel_cushion_obj, phase, expected_description):
     """Test get_formatted_passive_description formats based on phase."""
     eq_wengine = WEngine(steel_cushion_obj, level=60, modification=5, phase=phase)
-    formatted = eq_wengine.get_formatted_passive_description()
-    assert isinstance(formatted, str)
-    assert expected_desc_part_1 in formatted
-    assert expected_desc_part_2 in formatted
\ No newline at end of file
+    assert eq_wengine.get_formatted_passive_description() == expected_description
\ No newline at end of file